@@ -0,0 +1,11 @@
+from .client import AsyncClient, AIO_CLIENT
+from . import (
+    alert_requests,
+    asset_requests,
+    job_requests,
+    resource_requests,
+    roster_requests,
+    session_requests,
+    trx_requests,
+    wo_requests
+)
@@ -0,0 +1,12 @@
+from ..config import CONFIG
+from ..alert.alert_requests import simple_alert_jdict, _parse_post
+from .client import AIO_CLIENT
+
+
+async def post(jdict: dict) -> None:
+    url = f"{CONFIG.ALERT_URL}"
+    r = await AIO_CLIENT.post(url, json=jdict)
+    _parse_post(url, r)
+
+async def simple_alert(to_user: str, note: str, from_user: str=..., date: str=...) -> None:
+    await post(simple_alert_jdict(to_user, note, from_user, date))
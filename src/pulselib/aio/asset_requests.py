@@ -0,0 +1,57 @@
+from typing import Awaitable, Callable
+
+from ..config import CONFIG
+from ..errors import RequestAppliedError
+from .client import AIO_CLIENT
+from ..asset.asset_requests import (
+    _query_url,
+    _asset_url,
+    _audio_url,
+    _parse_query,
+    _parse_asset,
+    _parse_patch,
+    _parse_post,
+    _parse_audio,
+    _parse_audio_write
+)
+
+
+async def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = await AIO_CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+async def get(assetno: str) -> dict:
+    url = _asset_url(assetno)
+    r = await AIO_CLIENT.get(url)
+    return _parse_asset(url, r, assetno)
+
+async def patch(assetno: str, patchlist: list[dict]) -> None:
+    url = _asset_url(assetno)
+    r = await AIO_CLIENT.patch(url, json=patchlist)
+    _parse_patch(url, r, assetno)
+
+async def post(jdict: dict, filename: str, precheck: Callable[[], Awaitable[bool]] | None = None) -> bool:
+    """ Same as asset_requests.post, precheck is a coroutine function """
+    url = f"{CONFIG.ASSET_URL}"
+    try:
+        r = await AIO_CLIENT.post(url, json=jdict, retry=precheck is not None, precheck=precheck)
+    except RequestAppliedError:
+        return False
+    _parse_post(url, r, filename)
+    return True
+
+async def get_audio(asset_no: str) -> list[dict]:
+    url = _audio_url(asset_no)
+    r = await AIO_CLIENT.get(url)
+    return _parse_audio(url, r, asset_no)
+
+async def post_audio(asset_no: str, info: list[dict]) -> None:
+    url = _audio_url(asset_no)
+    r = await AIO_CLIENT.post(url, json=info)
+    _parse_audio_write(url, r, asset_no)
+
+async def patch_audio(asset_no: str, audio_list_no: str, patchlist: list[dict]) -> None:
+    url = _audio_url(asset_no, audio_list_no)
+    r = await AIO_CLIENT.patch(url, json=patchlist)
+    _parse_audio_write(url, r, asset_no)
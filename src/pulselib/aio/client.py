@@ -0,0 +1,112 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from ..config import CONFIG
+from ..errors import RequestAppliedError
+from ..governor import GOVERNOR, Governor
+from ..retry import RetryPolicy
+
+
+class AsyncClient:
+    """
+    Async counterpart to pulselib.client.Client.
+    The underlying httpx client and the concurrency semaphore are bound
+    to the running event loop, so both are created lazily on first use.
+    Responses are read in full before the governor slot is released, there is no streaming mode.
+    """
+    def __init__(self, auth: tuple[str, str] | None = None,
+                 timeout: tuple[float, float] | None = None,
+                 max_concurrency: int | None = None,
+                 headers: dict[str, str] | None = None,
+                 retry_policy: RetryPolicy | None = None,
+                 governor: Governor | None = None) -> None:
+        self.auth = auth if auth is not None else (CONFIG.USERNAME, CONFIG.PASSWORD)
+        self.timeout = timeout if timeout is not None else CONFIG.MP_TIMEOUT
+        self.max_concurrency = max_concurrency if max_concurrency is not None else CONFIG.AIO_MAX_CONCURRENCY
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.governor = governor if governor is not None else GOVERNOR
+        self.headers = {"Accept": "application/json"}
+        if headers is not None:
+            self.headers.update(headers)
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # clients left behind by a previous event loop, closed by close()
+        self._stale: list[httpx.AsyncClient] = []
+
+    def _retire(self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            self._stale.append(client)
+
+    def _bind(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._semaphore is None or self._loop is not loop:
+            if self._client is not None:
+                self._retire(self._client, self._loop)
+            connect, read = self.timeout
+            self._client = httpx.AsyncClient(
+                auth=self.auth,
+                headers=self.headers,
+                timeout=httpx.Timeout(read, connect=connect),
+                limits=httpx.Limits(max_connections=self.max_concurrency,
+                                    max_keepalive_connections=self.max_concurrency)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client, self._semaphore
+
+    async def request(self, method: str, url: str, retry: bool | None = None,
+                      precheck: Callable[[], Awaitable[bool]] | None = None, **kwargs: Any) -> httpx.Response:
+        """
+        Same retry semantics as Client.request, precheck is a coroutine function.
+        The body is read before returning, so a reset mid-body is retried like any transport error.
+        """
+        client, semaphore = self._bind()
+        policy = self.retry_policy
+        retries = policy.retries if policy.should_retry(method, retry) else 0
+        attempt = 0
+        while True:
+            try:
+                async with semaphore, self.governor.aslot(url):
+                    response = await client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt >= retries:
+                    raise
+            else:
+                if attempt >= retries or response.status_code not in policy.retry_statuses:
+                    return response
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(policy.delay(attempt))
+            if precheck is not None and await precheck():
+                raise RequestAppliedError(method, url)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, json: Any = None, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, json=json, **kwargs)
+
+    async def patch(self, url: str, json: Any = None, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, json=json, **kwargs)
+
+    async def close(self) -> None:
+        stale, self._stale = self._stale, []
+        for client in stale:
+            try:
+                await client.aclose()
+            except Exception:
+                # its connections belong to a loop that's gone, nothing left to release
+                pass
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+
+AIO_CLIENT = AsyncClient()
@@ -0,0 +1,25 @@
+import asyncio
+
+from .client import AIO_CLIENT
+from ..job.job_requests import (
+    SALES_OFFICES,
+    _query_url,
+    _job_url,
+    _parse_query,
+    _parse_job
+)
+
+
+async def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = await AIO_CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+async def get(job_num: str) -> dict:
+    url = _job_url(job_num)
+    r = await AIO_CLIENT.get(url)
+    return _parse_job(url, r, job_num)
+
+async def get_project_manager_desc(sale_office_no: str) -> str:
+    """ Served from the shared SALES_OFFICES table, a (re)load runs in a worker thread """
+    return await asyncio.to_thread(SALES_OFFICES.desc, sale_office_no)
@@ -0,0 +1,99 @@
+from ..config import CONFIG
+from ..errors import ResourceNotFoundError, RequestAppliedError
+from .client import AIO_CLIENT
+from ..resource.resource_requests import (
+    _query_url,
+    _resource_url,
+    _qualification_url,
+    _resource_qual_url,
+    _group_resources_url,
+    _resource_qual_payload,
+    _group_resource_payload,
+    _parse_query,
+    _parse_record,
+    _parse_patch,
+    _parse_post,
+    _parse_write,
+    _parse_qualification_post,
+    _parse_qualifications,
+    _parse_group_resources
+)
+
+
+async def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = await AIO_CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+async def get(resource_code: str) -> dict:
+    url = _resource_url(resource_code)
+    r = await AIO_CLIENT.get(url)
+    return _parse_record(url, r, resource_code)
+
+async def patch(resource_code: str, patchlist: list[dict]) -> None:
+    url = _resource_url(resource_code)
+    r = await AIO_CLIENT.patch(url, json=patchlist)
+    _parse_patch(url, r, resource_code)
+
+async def _exists(resource_code: str) -> bool:
+    try:
+        await get(resource_code)
+    except ResourceNotFoundError:
+        return False
+    return True
+
+async def post(jdict: dict, retry: bool = False) -> bool:
+    """ Same as resource_requests.post """
+    url = f"{CONFIG.RESOURCE_URL}"
+    precheck = None
+    if retry:
+        resource_code = jdict["resource_code"]["resource_code"]
+        precheck = lambda: _exists(resource_code)
+    try:
+        r = await AIO_CLIENT.post(url, json=jdict, retry=retry, precheck=precheck)
+    except RequestAppliedError:
+        return False
+    _parse_post(url, r, jdict)
+    return True
+
+
+async def query_qualifications(query: dict | None = None) -> list[dict]:
+    """
+    This endpoint does not support standard querying.
+    It will return all qualifactions regardless of the query.
+    Filtering is done in the function itself.
+    """
+    url = f"{CONFIG.QUALIFICATION_URL}"
+    r = await AIO_CLIENT.get(url)
+    return _parse_qualifications(url, r, query)
+
+async def get_qualification(qual_no: str) -> dict:
+    url = _qualification_url(qual_no)
+    r = await AIO_CLIENT.get(url)
+    return _parse_record(url, r, qual_no)
+
+async def post_qualification(jdict: dict) -> int | str | None:
+    """ Returns the new qualification_no if the server reports it """
+    url = f"{CONFIG.QUALIFICATION_URL}"
+    r = await AIO_CLIENT.post(url, json=jdict)
+    return _parse_qualification_post(url, r, jdict)
+
+async def add_qual_to_resource(res_code: str, qual_no: str) -> None:
+    url = _resource_qual_url(res_code)
+    r = await AIO_CLIENT.post(url, json=_resource_qual_payload(res_code, qual_no))
+    _parse_write(url, r, res_code)
+
+async def get_group_resources(group_code: str) -> list[dict]:
+    url = _group_resources_url(group_code)
+    r = await AIO_CLIENT.get(url)
+    return _parse_group_resources(url, r, group_code)
+
+async def post_resource_to_group(group_code: str, resource_code: str, isdefault: bool = True) -> None:
+    url = _group_resources_url(group_code)
+    r = await AIO_CLIENT.post(url, json=_group_resource_payload(group_code, resource_code, isdefault))
+    _parse_write(url, r, f"{group_code}")
+
+async def patch_groupresource(groupcode: str, resource_code: str, patchlist: list[dict]) -> None:
+    url = _group_resources_url(groupcode, resource_code)
+    r = await AIO_CLIENT.patch(url, json=patchlist)
+    _parse_write(url, r, f"{groupcode} - {resource_code}: ")
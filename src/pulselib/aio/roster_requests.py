@@ -0,0 +1,16 @@
+from ..roster.model import RosterTimeOff
+from ..roster.roster_requests import _gen_by_date_query, _query_url, _parse_query
+from .client import AIO_CLIENT
+
+
+async def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = await AIO_CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+async def by_date(daterange: tuple[str, str] | None = None, maintenance_only: bool=True) -> list[RosterTimeOff]:
+    jdict_list = await query(_gen_by_date_query(daterange, maintenance_only))
+    if jdict_list:
+        return [RosterTimeOff(jdict) for jdict in jdict_list]
+    else:
+        return []
@@ -0,0 +1,38 @@
+from ..config import CONFIG
+from .client import AIO_CLIENT
+from ..asset.sessions.session_requests import (
+    _query_url,
+    _session_url,
+    _issues_url,
+    _parse_query,
+    _parse_session,
+    _parse_post,
+    _parse_write
+)
+
+
+async def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = await AIO_CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+async def get(session_no: str) -> dict:
+    url = _session_url(session_no)
+    r = await AIO_CLIENT.get(url)
+    return _parse_session(url, r, session_no)
+
+async def post(payload: dict) -> str | None:
+    """ Returns the new session_no if the server reports it """
+    url = f"{CONFIG.ASSET_SESSION_URL}"
+    r = await AIO_CLIENT.post(url, json=payload)
+    return _parse_post(url, r, payload)
+
+async def patch(session_no: str, updatelist: list[dict]) -> None:
+    url = _session_url(session_no)
+    r = await AIO_CLIENT.patch(url, json=updatelist)
+    _parse_write(url, r, session_no)
+
+async def post_issues(session_no: str, issues: list[dict]) -> None:
+    url = _issues_url(session_no)
+    r = await AIO_CLIENT.post(url, json=issues)
+    _parse_write(url, r, session_no)
@@ -0,0 +1,40 @@
+import json
+from typing import overload, Literal
+
+from ..trx import Transaction
+from ..trx.trx_requests import (
+    _gen_query,
+    _excluded_phases,
+    _gen_resultcolumns,
+    _gen_listquery_url,
+    _parse_list_query,
+    _by_date_results
+)
+from .client import AIO_CLIENT
+
+
+async def _list_query(query: str, resultcolumns: str) -> list[dict]:
+    fullurl = _gen_listquery_url(query, resultcolumns)
+    res = await AIO_CLIENT.get(fullurl)
+    return _parse_list_query(fullurl, res)
+
+async def query(querydict: dict, columns: list[str] | None = None) -> list[dict]:
+    query = json.dumps(querydict, indent=0)
+    resultcolumns = _gen_resultcolumns(columns)
+    return await _list_query(query, resultcolumns)
+
+@overload
+async def by_date(daterange: tuple[str, str] | None = None,
+                  onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                  raw: Literal[True]=True) -> list[dict]:...
+@overload
+async def by_date(daterange: tuple[str, str] | None = None,
+                  onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                  raw: Literal[False]=False) -> list[Transaction]:...
+async def by_date(daterange: tuple[str, str] | None = None,
+                  onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                  raw: bool=False):
+    query = _gen_query(daterange, _excluded_phases(onhold, invoiced, proposed, inprogress))
+    resultcolumns = _gen_resultcolumns()
+    response = await _list_query(query, resultcolumns)
+    return _by_date_results(response, onhold, invoiced, proposed, inprogress, raw)
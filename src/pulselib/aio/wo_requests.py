@@ -0,0 +1,30 @@
+from .client import AIO_CLIENT
+from ..wo.wo_requests import (
+    _query_url,
+    _wo_url,
+    _source_url,
+    _parse_query,
+    _parse_wo,
+    _parse_patch
+)
+
+
+async def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = await AIO_CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+async def get(wo_num: str) -> dict:
+    url = _wo_url(wo_num)
+    r = await AIO_CLIENT.get(url)
+    return _parse_wo(url, r, wo_num)
+
+async def patch(wo_no: str, patchlist: list[dict]) -> None:
+    url = _wo_url(wo_no)
+    r = await AIO_CLIENT.patch(url, json=patchlist)
+    _parse_patch(url, r, wo_no)
+
+async def patch_source(wo_no: str, seq_no: int, patchlist: list[dict]) -> None:
+    url = _source_url(wo_no, seq_no)
+    r = await AIO_CLIENT.patch(url, json=patchlist)
+    _parse_patch(url, r, wo_no)
@@ -1,24 +1,23 @@
-import json
-import requests
 from datetime import datetime
 
 from ..errors import AlertUncaughtError
 
 from .. import utils
 from ..config import CONFIG
+from ..client import CLIENT
+
+
+def _parse_post(url: str, r: utils.AnyResponse) -> None:
+    """ Shared with aio.alert_requests """
+    utils.parse_write(url, r, AlertUncaughtError)
 
 
 def post(jdict: dict) -> None:
     url = f"{CONFIG.ALERT_URL}"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=jdict)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise AlertUncaughtError(err)
+    r = CLIENT.post(url, json=jdict)
+    _parse_post(url, r)
 
-def simple_alert(to_user: str, note: str, from_user: str=..., date: str=...) -> None:
+def simple_alert_jdict(to_user: str, note: str, from_user: str=..., date: str=...) -> dict:
     if date is ...:
         date = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     if from_user is ...:
@@ -33,4 +32,7 @@ def simple_alert(to_user: str, note: str, from_user: str=..., date: str=...) ->
         "send_date": date,
         "note_text": note
     }
-    post(jdict)
\ No newline at end of file
+    return jdict
+
+def simple_alert(to_user: str, note: str, from_user: str=..., date: str=...) -> None:
+    post(simple_alert_jdict(to_user, note, from_user, date))
\ No newline at end of file
@@ -1,5 +1,6 @@
 from . import audio
 from . import sessions
 from .model import Asset
-from .probe import get_mediainfo
+from .probe import get_mediainfo, file_exists, files_exist, probe_health
+from .lookup import ASSET_CACHE, get_asset_by_no, get_assets_by_no, get_assets_by_path
 from .specinterface import SpecInterface, SpecInfo
\ No newline at end of file
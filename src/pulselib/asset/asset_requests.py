@@ -1,83 +1,100 @@
-import json
-import requests
+from typing import Callable, Iterator
 
-from ..errors import AssetNotFoundError, AssetUncaughtError, AssetAudioUncaughtError
+from ..errors import AssetNotFoundError, AssetUncaughtError, AssetAudioUncaughtError, RequestAppliedError
 
 from .. import utils
+from ..cache import TTLCache
 from ..config import CONFIG
+from ..client import CLIENT
 
+# Full LibMaster jdicts keyed by str(master_no), shared by every WorkOrder in the process.
+# Filled by lookup.get_asset_by_no, every successful write here or in aio.asset_requests evicts the asset it touched.
+ASSET_CACHE: TTLCache[str, dict] = TTLCache(CONFIG.ASSET_CACHE_TTL, keyfunc=str)
 
-def query(query: dict) -> list[dict]:
-    url = f"{CONFIG.ASSET_QUERY_URL}/?query={query}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    if not isinstance(body, list):
-        err = body.get("error")
-        if err:
-            raise AssetUncaughtError(query, err)
-    return body
+# URL building and response parsing, shared with aio.asset_requests
+
+def _query_url(query: dict, columns: list[str] | None = None) -> str:
+    return f"{CONFIG.ASSET_QUERY_URL}/?query={query}{utils.resultcolumns_param(columns)}"
+
+def _asset_url(assetno: str) -> str:
+    return f"{CONFIG.ASSET_URL}/master_no={str(assetno)}"
+
+def _audio_url(asset_no: str, audio_list_no: str | None = None) -> str:
+    url = f"{_asset_url(asset_no)}/lib_master_audio"
+    if audio_list_no is not None:
+        url += f"/audio_channel_no={str(audio_list_no)}"
+    return url
+
+def _parse_query(url: str, r: utils.AnyResponse, query: dict) -> list[dict]:
+    return utils.parse_list(url, r, lambda err: AssetUncaughtError(query, err))
+
+def _parse_asset(url: str, r: utils.AnyResponse, assetno: str) -> dict:
+    return utils.parse_record(url, r, lambda err: AssetUncaughtError(assetno, err),
+                              lambda: AssetNotFoundError(assetno))
+
+def _parse_patch(url: str, r: utils.AnyResponse, assetno: str) -> None:
+    """ Evicts the asset from ASSET_CACHE once the write is verified """
+    utils.parse_write(url, r, lambda err: AssetUncaughtError(assetno, err),
+                      lambda: AssetNotFoundError(assetno))
+    ASSET_CACHE.invalidate(assetno)
+
+def _parse_post(url: str, r: utils.AnyResponse, filename: str) -> None:
+    utils.parse_write(url, r, lambda err: AssetUncaughtError(filename, err))
+
+def _parse_audio(url: str, r: utils.AnyResponse, asset_no: str) -> list[dict]:
+    return utils.parse_list(url, r, lambda err: AssetAudioUncaughtError(asset_no, err))
+
+def _parse_audio_write(url: str, r: utils.AnyResponse, asset_no: str) -> None:
+    """ Evicts the asset from ASSET_CACHE once the write is verified """
+    utils.parse_write(url, r, lambda err: AssetAudioUncaughtError(asset_no, err))
+    ASSET_CACHE.invalidate(asset_no)
+
+
+def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+def iter_query(query: dict, columns: list[str] | None = None) -> Iterator[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url, stream=True)
+    yield from utils.iter_json_array(url, r, lambda err: AssetUncaughtError(query, err))
 
 def get(assetno: str) -> dict:
-    url = f"{CONFIG.ASSET_URL}/master_no={str(assetno)}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    err = body.get("error")
-    if err:
-        if err.startswith("Alternate key not found:"):
-            raise AssetNotFoundError(assetno)
-        else:
-            raise AssetUncaughtError(assetno, err)
-    return body
+    url = _asset_url(assetno)
+    r = CLIENT.get(url)
+    return _parse_asset(url, r, assetno)
 
 def patch(assetno: str, patchlist: list[dict]) -> None:
-    url = f"{CONFIG.ASSET_URL}/master_no={str(assetno)}"
-    r = requests.patch(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=patchlist)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            if err.startswith("Alternate key not found:"):
-                raise AssetNotFoundError(assetno)
-            else:
-                raise AssetUncaughtError(assetno, err)
-
-def post(jdict: dict, filename: str) -> None:
+    url = _asset_url(assetno)
+    r = CLIENT.patch(url, json=patchlist)
+    _parse_patch(url, r, assetno)
+
+def post(jdict: dict, filename: str, precheck: Callable[[], bool] | None = None) -> bool:
+    """
+    precheck: enables retries, it's called before each one and should return True if the asset now exists.
+    In that case the earlier attempt went through and nothing is resent.
+    Returns False when that happened: the asset exists but its POST response was never seen.
+    """
     url = f"{CONFIG.ASSET_URL}"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=jdict)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise AssetUncaughtError(filename, err)
+    try:
+        r = CLIENT.post(url, json=jdict, retry=precheck is not None, precheck=precheck)
+    except RequestAppliedError:
+        return False
+    _parse_post(url, r, filename)
+    return True
 
 def get_audio(asset_no: str) -> list[dict]:
-    url = f"{CONFIG.ASSET_URL}/master_no={str(asset_no)}/lib_master_audio"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    if not isinstance(body, list):
-        err = body.get("error")
-        if err:
-            raise AssetAudioUncaughtError(asset_no, err)
-    return body
+    url = _audio_url(asset_no)
+    r = CLIENT.get(url)
+    return _parse_audio(url, r, asset_no)
 
 def post_audio(asset_no: str, info: list[dict]) -> None:
-    url = f"{CONFIG.ASSET_URL}/master_no={str(asset_no)}/lib_master_audio"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=info)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise AssetAudioUncaughtError(asset_no, err)
+    url = _audio_url(asset_no)
+    r = CLIENT.post(url, json=info)
+    _parse_audio_write(url, r, asset_no)
 
 def patch_audio(asset_no: str, audio_list_no: str, patchlist: list[dict]) -> None:
-    url = f"{CONFIG.ASSET_URL}/master_no={str(asset_no)}/lib_master_audio/audio_channel_no={str(audio_list_no)}"
-    r = requests.patch(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=patchlist)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise AssetAudioUncaughtError(asset_no, err)
\ No newline at end of file
+    url = _audio_url(asset_no, audio_list_no)
+    r = CLIENT.patch(url, json=patchlist)
+    _parse_audio_write(url, r, asset_no)
@@ -1,4 +1,4 @@
-from ..fieldmaps import SimpleFieldMap, FieldTypeEnum
+from ..fieldmaps import SimpleFieldMap, FieldTypeEnum, result_columns
 
 NEW_ASSET_TEMPLATE = {
     "asset_type_no": {
@@ -71,4 +71,6 @@ ASSET_FIELD_MAPS = {
     "audio_bitdepth": SimpleFieldMap("audio_bitdepth", FieldTypeEnum.STRING, "REI_field_14"),
     "audio_bitrate_mode": SimpleFieldMap("audio_bitrate_mode", FieldTypeEnum.STRING, "REI_field_25"),
     "audio_samplerate": SimpleFieldMap("audio_samplerate", FieldTypeEnum.STRING, "REI_field_22")
-}
\ No newline at end of file
+}
+
+ASSET_PATH_COLUMNS = result_columns({key: ASSET_FIELD_MAPS[key] for key in ("assetno", "filename", "filepath")})
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from .tracks import TrackIndex, index_tracks
+
 if TYPE_CHECKING:
     from mediaprobe import MediaProbe
 
@@ -43,13 +45,12 @@ def _predict_singlestream_51(layouts: list[str], startindex: int=0) -> bool:
             return False
     return True
 
-def _get_layouts(probe: "MediaProbe") -> list[str]:
+def _get_layouts(tracks: TrackIndex) -> list[str]:
     layouts = []
-    for track in probe.fulljson["tracks"]:
-        if track["@type"] == "Audio":
-            layout = track.get("ChannelLayout")
-            if layout:
-                layouts.append(layout)
+    for track in tracks.get("Audio", []):
+        layout = track.get("ChannelLayout")
+        if layout:
+            layouts.append(layout)
     return layouts
 
 def _layout_handler(asset_no: str, chs_per_stream: list[int], layouts: list[str]) -> list[dict]:
@@ -90,12 +91,13 @@ def _nolayout_handler(asset_no: str, probe: "MediaProbe") -> list[dict]:
         index += channels
     return ch_dicts
 
-def asset_audio_dict(asset_no: str, probe: "MediaProbe") -> list[dict]:
+def asset_audio_dict(asset_no: str, probe: "MediaProbe", tracks: TrackIndex | None = None) -> list[dict]:
+    """ tracks: index_tracks(probe) if already built """
     total_chs = probe.audio()
     if total_chs < 1:
         return []
     
-    layouts = _get_layouts(probe)
+    layouts = _get_layouts(tracks if tracks is not None else index_tracks(probe))
     if layouts:
         return _layout_handler(asset_no, probe.chs_per_stream(), layouts)
     else:
@@ -0,0 +1,78 @@
+import copy
+from pathlib import Path
+from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import CONFIG
+from ..errors import MultipleAssetsFoundError
+
+from . import asset_requests
+from .asset_requests import ASSET_CACHE
+from .assetfieldmaps import ASSET_FIELD_MAPS
+
+def get_asset_by_no(assetno: str, refresh: bool = False) -> dict:
+    """ Cached asset_requests.get, returns a copy that's safe to mutate """
+    jdict = None if refresh else ASSET_CACHE.get(assetno)
+    if jdict is None:
+        jdict = asset_requests.get(assetno)
+        ASSET_CACHE.set(assetno, jdict)
+    return copy.deepcopy(jdict)
+
+def get_assets_by_no(assetnos: Iterable[str], refresh: bool = False, max_workers: int | None = None) -> dict[str, dict]:
+    """
+    Bulk version of get_asset_by_no.
+    Assets missing from ASSET_CACHE are fetched concurrently, each distinct assetno once.
+    """
+    unique = list(dict.fromkeys(assetnos))
+    missing = [no for no in unique if refresh or no not in ASSET_CACHE]
+    if missing:
+        workers = max_workers if max_workers is not None else CONFIG.MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+            ASSET_CACHE.update(zip(missing, executor.map(asset_requests.get, missing)))
+    return {no: get_asset_by_no(no) for no in unique}
+
+
+def get_assets_by_path(paths: Iterable[str], chunk_size: int = 50, columns: list[str] | None = None,
+                       errors: dict[str, Exception] | None = None) -> dict[str, dict]:
+    """
+    Bulk version of Asset.get_asset.
+    Paths are grouped by directory and resolved with one $in query per directory (per chunk_size files).
+    Returns {path: asset jdict} for every given path, with {} for paths that have no asset.
+    Raises MultipleAssetsFoundError if any single path matches more than one asset.
+    errors: collects failures instead of raising, {path: exception} for every path a failed
+    query (or ambiguous match) covered. Those paths are left out of the result.
+    """
+    filename_key = ASSET_FIELD_MAPS["filename"].keys
+    filepath_key = ASSET_FIELD_MAPS["filepath"].keys
+
+    by_dir: dict[str, dict[str, list[str]]] = {}
+    for path in paths:
+        fullpath = Path(path)
+        by_dir.setdefault(str(fullpath.parent), {}).setdefault(fullpath.name, []).append(path)
+
+    found: dict[str, dict] = {}
+    for directory, names in by_dir.items():
+        namelist = list(names)
+        for i in range(0, len(namelist), chunk_size):
+            chunk = namelist[i:i+chunk_size]
+            try:
+                results = asset_requests.query({filename_key: {"$in": chunk}, filepath_key: directory}, columns)
+            except Exception as e:
+                if errors is None:
+                    raise
+                errors.update((path, e) for name in chunk for path in names[name])
+                continue
+            matches: dict[str, list[dict]] = {}
+            for jdict in results:
+                matches.setdefault(jdict.get(filename_key), []).append(jdict)
+            for name in chunk:
+                assetdicts = matches.get(name, [])
+                if len(assetdicts) > 1:
+                    e = MultipleAssetsFoundError({filename_key: name, filepath_key: directory}, assetdicts)
+                    if errors is None:
+                        raise e
+                    errors.update((path, e) for path in names[name])
+                    continue
+                for path in names[name]:
+                    found[path] = assetdicts[0] if assetdicts else {}
+    return found
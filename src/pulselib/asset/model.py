@@ -8,10 +8,11 @@ from ..errors import (
     MultipleAssetsFoundError
 )
 
-from .probe import get_mediainfo
+from .probe import get_mediainfo, file_exists, files_exist
 from . import asset_requests, audio
+from .lookup import get_asset_by_no
 from .specinterface import SpecInterface
-from .assetfieldmaps import ASSET_FIELD_MAPS, NEW_ASSET_TEMPLATE
+from .assetfieldmaps import ASSET_FIELD_MAPS, ASSET_PATH_COLUMNS, NEW_ASSET_TEMPLATE
 
 if TYPE_CHECKING:
     from mediaprobe import MediaProbe
@@ -52,7 +53,7 @@ class Asset:
 
     def refresh(self) -> None:
         if self.assetno:
-            self.jdict = asset_requests.get(self.assetno)
+            self.jdict = get_asset_by_no(self.assetno, refresh=True)
         else:
             results = self.get_asset()
             if not results:
@@ -72,13 +73,26 @@ class Asset:
             path = self._get_path()
             if not path:
                 return False
-        try:
-            get_mediainfo(str(path))
-        except FileNotFoundError:
-            self._file_exists = False
-            return False
-        self._file_exists = True
-        return True
+        self._file_exists = file_exists(str(path))
+        return self._file_exists
+
+    @staticmethod
+    def files_exist(assets: list["Asset"], retry: bool=False, max_workers: int | None = None) -> list[bool]:
+        """ Bulk file_exists, results are in the same order as assets """
+        pending: dict[str, list[Asset]] = {}
+        for asset in assets:
+            if not retry and asset._file_exists is not None:
+                continue
+            path = asset.get_path()
+            if not path:
+                asset._file_exists = False
+                continue
+            pending.setdefault(str(path), []).append(asset)
+        found = files_exist(pending, max_workers=max_workers)
+        for path, pathassets in pending.items():
+            for asset in pathassets:
+                asset._file_exists = found[path]
+        return [bool(asset._file_exists) for asset in assets]
 
     def find_key(self, key: str) -> Any:
         return ASSET_FIELD_MAPS[key].read(self.jdict)
@@ -94,18 +108,27 @@ class Asset:
         self._wasprobed = True
         self._file_exists = True
 
-    def patch(self) -> None:
+    def patch(self, diffonly: bool=False) -> bool:
+        """
+        diffonly: only sends the spec fields that differ from self.jdict, which should be a full record.
+        Returns False if there was nothing to patch.
+        """
         if not self.assetno:
             raise RuntimeError(f"Attempted to patch asset w/o assetno: {self.specinterface.path}")
         if not self._wasprobed:
             self.probefile()
-        asset_requests.patch(self.assetno, self.specinterface.patch_ops())
+        patchops = self.specinterface.patch_ops(self.jdict if diffonly else None)
+        if not patchops:
+            return False
+        asset_requests.patch(self.assetno, patchops)
+        return True
 
-    def post_new(self, audiolayout: bool=True) -> None:
+    def post_new(self, audiolayout: bool=True, existing: dict=...) -> None:
+        """ existing: result of a prior get_asset/get_assets_by_path lookup, skips the query """
         if self.assetno:
             raise AssetExistsError(f"Assetno: {self.assetno} - {self.specinterface.path}")
         else:
-            exists = self.get_asset()
+            exists = self.get_asset(columns=ASSET_PATH_COLUMNS) if existing is ... else existing
             if exists:
                 assetno = ASSET_FIELD_MAPS["assetno"].read(exists)
                 raise AssetExistsError(f"Assetno: {assetno} - {self.specinterface.path}")
@@ -121,12 +144,13 @@ class Asset:
         jdict.update(ASSET_FIELD_MAPS["filepath"].makejdict(str(fullpath.parent)))
         jdict.update(ASSET_FIELD_MAPS["asset_desc"].makejdict(fullpath.name[:60]))
 
-        asset_requests.post(jdict, self.specinterface.path)
+        asset_requests.post(jdict, self.specinterface.path,
+                            precheck=lambda: bool(self.get_asset(columns=ASSET_PATH_COLUMNS)))
 
         if audiolayout:
             self._audio()
 
-    def get_asset(self) -> dict:
+    def get_asset(self, columns: list[str] | None = None) -> dict:
         filename_key = ASSET_FIELD_MAPS["filename"].keys
         filepath_key = ASSET_FIELD_MAPS["filepath"].keys
         if self.specinterface.path:
@@ -140,7 +164,7 @@ class Asset:
                 raise AssetPathNotFoundError(f"Asset._find_asset: {self.assetno} - {self.specinterface.path}")
             query = {filename_key: fullpath.name, filepath_key: str(fullpath.parent)}
 
-        results = asset_requests.query(query)
+        results = asset_requests.query(query, columns)
         if len(results) > 1:
             raise MultipleAssetsFoundError(query, results)
         elif len(results) < 1:
@@ -153,7 +177,7 @@ class Asset:
             raise AssetRefreshError(f"Asset._audio: Unable to get assetno after refresh: {self.specinterface.path}")
         if not self.probe:
             raise AssetRefreshError(f"Asset._audio: Unable to get probe after refresh: {self.specinterface.path}")
-        audiolayout = audio.asset_audio_dict(self.assetno, self.probe)
+        audiolayout = audio.asset_audio_dict(self.assetno, self.probe, self.specinterface.tracks or None)
         asset_requests.post_audio(self.assetno, audiolayout)
 
     def _get_path(self) -> Path | None:
@@ -1,17 +1,106 @@
+import os
 import json
+import logging
 import requests
+from pathlib import Path
+from typing import Iterable
 from urllib import error
+from concurrent.futures import ThreadPoolExecutor
 
 from mediaprobe import MediaProbe
+from rosettapath import RosettaPath
 
 from ..config import CONFIG
+from ..breaker import CircuitBreaker
+from ..errors import ProbeServiceUnavailableError
+from .probecache import PROBE_CACHE
 
-def get_mediainfo(file: str) -> MediaProbe:
-    res = requests.post(url=CONFIG.MEDIAINFO_URL, json={"path": file})
+logger = logging.getLogger(__name__)
+
+PROBE_BREAKER = CircuitBreaker(
+    "mediainfo_probe",
+    ProbeServiceUnavailableError,
+    failure_threshold=CONFIG.PROBE_BREAKER_THRESHOLD,
+    reset_timeout=CONFIG.PROBE_BREAKER_RESET
+)
+
+def get_mediainfo(file: str, usecache: bool=True) -> MediaProbe:
+    cached = PROBE_CACHE.get(file) if usecache else None
+    if cached is not None:
+        mi, linuxpath = cached
+    else:
+        mi, linuxpath = _probe_service(file)
+        if usecache:
+            PROBE_CACHE.set(file, mi, linuxpath)
+    probe = MediaProbe(file, jsondict=mi)
+    probe.filepath = linuxpath
+    return probe
+
+def local_exists(file: str) -> bool | None:
+    """
+    Answers existence with a local stat when the file's volume is mounted here.
+    A file is only reported missing when the CONFIG.VOLUME_ROOTS entry it lives under is itself a mount point.
+    Returns None in every other case so a probe decides.
+    VOLUME_ROOTS is empty unless PULSELIB_VOLUME_ROOTS is set, until then this cheap negative path
+    is disabled and every missing file costs a probe (a warning is logged once).
+    """
+    candidates = [file, RosettaPath(file.replace("\"", "")).linux_path()]
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return True
+    for candidate in candidates:
+        if _on_mounted_volume(Path(candidate)):
+            return False
+    return None
+
+def file_exists(file: str) -> bool:
+    """ local_exists, falling back to a probe when the volume isn't mounted here """
+    exists = local_exists(file)
+    if exists is not None:
+        return exists
     try:
-        resjson = res.json()
-    except json.JSONDecodeError:
-        raise error.URLError(f"Invalid JSON response from MediaInfo endpoint. Check URL and PORT: {CONFIG.MEDIAINFO_URL}\n{res.text}", file)
+        get_mediainfo(file)
+    except FileNotFoundError:
+        return False
+    return True
+
+def files_exist(files: Iterable[str], max_workers: int | None = None) -> dict[str, bool]:
+    """ Bulk file_exists, files that need a probe are probed concurrently """
+    unique = list(dict.fromkeys(files))
+    if not unique:
+        return {}
+    workers = max_workers if max_workers is not None else CONFIG.MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=min(workers, len(unique))) as executor:
+        return dict(zip(unique, executor.map(file_exists, unique)))
+
+_warned_no_roots = False
+
+def _on_mounted_volume(path: Path) -> bool:
+    global _warned_no_roots
+    if not CONFIG.VOLUME_ROOTS and not _warned_no_roots:
+        _warned_no_roots = True
+        logger.warning("CONFIG.VOLUME_ROOTS is empty, missing files can't be detected locally and are probed. "
+                       "Set PULSELIB_VOLUME_ROOTS to the media mount points (separated by %r).", os.pathsep)
+    for root in CONFIG.VOLUME_ROOTS:
+        rootpath = Path(root)
+        if rootpath == path or rootpath in path.parents:
+            return os.path.ismount(rootpath)
+    return False
+
+def probe_health() -> dict[str, str | int | float]:
+    """ PROBE_BREAKER state and counters """
+    return PROBE_BREAKER.metrics()
+
+def _probe_service(file: str) -> tuple[dict, str]:
+    """ Raises ProbeServiceUnavailableError without contacting the service while PROBE_BREAKER is open """
+    with PROBE_BREAKER.guard():
+        res = requests.post(url=CONFIG.MEDIAINFO_URL, json={"path": file}, timeout=CONFIG.MEDIAINFO_TIMEOUT)
+        if res.status_code >= 500:
+            raise error.URLError(f"MediaInfo endpoint returned {res.status_code}: {CONFIG.MEDIAINFO_URL}\n{res.text}", file)
+        try:
+            resjson = res.json()
+        except json.JSONDecodeError:
+            raise error.URLError(f"Invalid JSON response from MediaInfo endpoint. Check URL and PORT: {CONFIG.MEDIAINFO_URL}\n{res.text}", file)
     err = resjson.get("error")
     if err:
         if err.startswith("Not a valid file path:"):
@@ -20,6 +109,4 @@ def get_mediainfo(file: str) -> MediaProbe:
             raise LookupError(err)
     mi = resjson["output"]["mediainfo"]
     linuxpath = resjson["output"]["linuxpath"]
-    probe = MediaProbe(file, jsondict=mi)
-    probe.filepath = linuxpath
-    return probe
\ No newline at end of file
+    return (mi, linuxpath)
\ No newline at end of file
@@ -0,0 +1,121 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+
+from rosettapath import RosettaPath
+
+from ..config import CONFIG
+
+
+class ProbeCache:
+    """
+    Disk-backed cache of MediaInfo probe results.
+    Entries are keyed by linux path and only reused while the file's size and mtime are unchanged.
+    Files that can't be stat'ed from this machine are never cached.
+    Cache errors are swallowed, a broken cache only means probing the service again.
+    If the database can't be opened at all the cache disables itself for the rest of the process.
+    """
+    FILENAME = "probes.sqlite3"
+
+    def __init__(self, cachedir: str | Path | None = None) -> None:
+        self.cachedir = Path(cachedir if cachedir is not None else CONFIG.PROBE_CACHE_DIR)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._disabled = False
+
+    @property
+    def dbpath(self) -> Path:
+        return self.cachedir / self.FILENAME
+
+    def _connect(self) -> sqlite3.Connection:
+        """ Caller holds the lock """
+        if self._conn is None:
+            if self._disabled:
+                raise sqlite3.OperationalError(f"Probe cache disabled: {self.dbpath}")
+            conn = None
+            try:
+                self.cachedir.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.dbpath), check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS probes ("
+                    "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+                    "linuxpath TEXT, mediainfo TEXT, cached_at REAL)"
+                )
+                conn.commit()
+            except (sqlite3.Error, OSError) as e:
+                # an unwritable cache dir or broken db file won't fix itself, stop retrying on every probe
+                self._disabled = True
+                if conn is not None:
+                    conn.close()
+                raise sqlite3.OperationalError(f"Unable to open probe cache: {self.dbpath} - {e}") from e
+            self._conn = conn
+        return self._conn
+
+    def _key(self, file: str) -> tuple[str, int, int] | None:
+        linux_path = RosettaPath(file.replace("\"", "")).linux_path()
+        for candidate in (file, linux_path):
+            try:
+                stat = os.stat(candidate)
+            except (OSError, ValueError):
+                continue
+            return (linux_path, stat.st_size, stat.st_mtime_ns)
+        return None
+
+    def get(self, file: str) -> tuple[dict, str] | None:
+        """ Returns (mediainfo, linuxpath) if a still-valid entry exists """
+        if self._disabled:
+            return None
+        key = self._key(file)
+        if key is None:
+            return None
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT mediainfo, linuxpath FROM probes WHERE path = ? AND size = ? AND mtime_ns = ?", key
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+        if row is None:
+            return None
+        try:
+            return (json.loads(row[0]), row[1])
+        except ValueError:
+            return None
+
+    def set(self, file: str, mediainfo: dict, linuxpath: str) -> None:
+        if self._disabled:
+            return
+        key = self._key(file)
+        if key is None:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO probes VALUES (?, ?, ?, ?, ?, ?)",
+                    (*key, linuxpath, json.dumps(mediainfo), time.time())
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            return
+
+    def invalidate(self, file: str | None = None) -> None:
+        if self._disabled:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                if file is None:
+                    conn.execute("DELETE FROM probes")
+                else:
+                    linux_path = RosettaPath(file.replace("\"", "")).linux_path()
+                    conn.execute("DELETE FROM probes WHERE path = ?", (linux_path,))
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            return
+
+
+PROBE_CACHE = ProbeCache()
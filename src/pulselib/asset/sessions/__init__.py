@@ -1,2 +1,3 @@
 from . import operations
-from . import session_requests
\ No newline at end of file
+from . import session_requests
+from . import uploader
\ No newline at end of file
@@ -1,11 +1,20 @@
+import copy
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
+from ...config import CONFIG
 from . import session_requests
 from .assetsessionmaps import (
     ASSET_SESSION_MAPS,
     SESSION_ISSUE_MAPS
 )
 
+@dataclass
+class SessionCopyResults:
+    copied: dict[str, str]
+    errors: list[str]
+
 
 def _strip_asset_info(sessiondict: dict) -> dict:
     new_dict = {}
@@ -34,18 +43,8 @@ def _is_recent_session(sessiondict: dict) -> bool:
     diff_plus = now + timedelta(minutes=2)
     return diff_minus <= session_time <= diff_plus
 
-def _copy_session_wout_issues(source_session: str, target_asset: str) -> tuple[str, list[dict]]:
-    """ Returns tuple of new session no and list of issues """
-    source_dict = session_requests.get(source_session)
-    issues = ASSET_SESSION_MAPS["issues"].read(source_dict)
-    if issues is None:
-        issues = []
-    else:
-        del source_dict[ASSET_SESSION_MAPS["issues"].keys]
-
-    new_dict = _format_session_copy(source_dict, target_asset)
-    session_requests.post(new_dict)
-
+def _find_recent_session(target_asset: str) -> str:
+    """ Fallback for when the POST response doesn't report the new session_no """
     target_sessions = session_requests.query({"keystring": target_asset})
     if not target_sessions:
         raise RuntimeError(f"Session copy to target asset failed, no sessions: {target_asset}")
@@ -57,8 +56,26 @@ def _copy_session_wout_issues(source_session: str, target_asset: str) -> tuple[s
     for session in recent_sessions:
         if session["date_added"] > most_recent["date_added"]:
             most_recent = session
-    most_recent_no = most_recent["session_no"]["session_no"]
-    return (most_recent_no, issues)
+    return most_recent["session_no"]["session_no"]
+
+def _copy_session_wout_issues(source_session: str, target_asset: str, source_dict: dict | None = None) -> tuple[str, list[dict]]:
+    """
+    Returns tuple of new session no and list of issues.
+    source_dict: an already fetched copy of source_session, it's modified in place.
+    """
+    if source_dict is None:
+        source_dict = session_requests.get(source_session)
+    issues = ASSET_SESSION_MAPS["issues"].read(source_dict)
+    if issues is None:
+        issues = []
+    else:
+        del source_dict[ASSET_SESSION_MAPS["issues"].keys]
+
+    new_dict = _format_session_copy(source_dict, target_asset)
+    new_session_no = session_requests.post(new_dict)
+    if new_session_no is None:
+        new_session_no = _find_recent_session(target_asset)
+    return (new_session_no, issues)
 
 def _replace_session_in_issues(issues: list[dict], new_session_no: str) -> None:
     if not issues:
@@ -82,14 +99,39 @@ def _gen_tc_events(tcs: list[tuple[str, str]]) -> list[dict]:
     return events
 
 
-def copy_session(source_session: str, target_asset: str) -> str:
+def copy_session(source_session: str, target_asset: str, source_dict: dict | None = None) -> str:
     """ Returns new session no """
-    new_session_no, issues = _copy_session_wout_issues(source_session, target_asset)
+    new_session_no, issues = _copy_session_wout_issues(source_session, target_asset, source_dict)
     _replace_session_in_issues(issues, new_session_no)
     session_requests.post_issues(new_session_no, issues)
     return new_session_no
 
 
+def copy_sessions(source_session: str, target_assets: list[str], max_workers: int | None = None) -> SessionCopyResults:
+    """
+    Copies source_session to every target asset concurrently, fetching the source once.
+    Returns {target_asset: new session no} and per-target errors.
+    """
+    copied: dict[str, str] = {}
+    errors: list[str] = []
+    targets = list(dict.fromkeys(target_assets))
+    if not targets:
+        return SessionCopyResults(copied, errors)
+    source_dict = session_requests.get(source_session)
+    workers = max_workers if max_workers is not None else CONFIG.MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=min(workers, len(targets))) as executor:
+        futures = [
+            executor.submit(copy_session, source_session, target, copy.deepcopy(source_dict))
+            for target in targets
+        ]
+        for target, future in zip(targets, futures):
+            try:
+                copied[target] = future.result()
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {target} - {e}")
+    return SessionCopyResults(copied, errors)
+
+
 def patch_po(session_no: str, po_num: str) -> None:
     patch = [{
         "op": "replace",
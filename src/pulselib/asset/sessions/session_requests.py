@@ -1,59 +1,56 @@
-import json
-import requests
-
 from ... import utils
 from ...config import CONFIG
+from ...client import CLIENT
 from ...errors import SessionNotFoundError, SessionUncaughtError
 
+# URL building and response parsing, shared with aio.session_requests
+
+def _query_url(query: dict, columns: list[str] | None = None) -> str:
+    return f"{CONFIG.ASSET_SESSION_QUERY_URL}/?query={query}{utils.resultcolumns_param(columns)}"
+
+def _session_url(session_no: str) -> str:
+    return f"{CONFIG.ASSET_SESSION_URL}/session_no={session_no}"
+
+def _issues_url(session_no: str) -> str:
+    return f"{_session_url(session_no)}/im_session_issue"
+
+def _parse_query(url: str, r: utils.AnyResponse, query: dict) -> list[dict]:
+    return utils.parse_list(url, r, lambda err: SessionUncaughtError(query, err))
+
+def _parse_session(url: str, r: utils.AnyResponse, session_no: str) -> dict:
+    return utils.parse_record(url, r, lambda err: SessionUncaughtError(session_no, err),
+                              lambda: SessionNotFoundError(session_no))
 
-def query(query: dict) -> list[dict]:
-    url = f"{CONFIG.ASSET_SESSION_QUERY_URL}/?query={query}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    if not isinstance(body, list):
-        err = body.get("error")
-        if err:
-            raise SessionUncaughtError(query, err)
-    return body
+def _parse_post(url: str, r: utils.AnyResponse, payload: dict) -> str | None:
+    jbody = utils.parse_write(url, r, lambda err: SessionUncaughtError(payload, err))
+    return utils.created_key("session_no", jbody, r.headers.get("Location"))
+
+def _parse_write(url: str, r: utils.AnyResponse, session_no: str) -> None:
+    utils.parse_write(url, r, lambda err: SessionUncaughtError(session_no, err))
+
+
+def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url)
+    return _parse_query(url, r, query)
 
 def get(session_no: str) -> dict:
-    url = f"{CONFIG.ASSET_SESSION_URL}/session_no={session_no}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    err = body.get("error")
-    if err:
-        if err.startswith("Alternate key not found:"):
-            raise SessionNotFoundError(session_no)
-        else:
-            raise SessionUncaughtError(session_no, err)
-    return body
-
-def post(payload: dict) -> None:
+    url = _session_url(session_no)
+    r = CLIENT.get(url)
+    return _parse_session(url, r, session_no)
+
+def post(payload: dict) -> str | None:
+    """ Returns the new session_no if the server reports it """
     url = f"{CONFIG.ASSET_SESSION_URL}"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=payload)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise SessionUncaughtError(payload, err)
-        
+    r = CLIENT.post(url, json=payload)
+    return _parse_post(url, r, payload)
+
 def patch(session_no: str, updatelist: list[dict]) -> None:
-    url = f"{CONFIG.ASSET_SESSION_URL}/session_no={session_no}"
-    r = requests.patch(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=updatelist)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise SessionUncaughtError(session_no, err)
+    url = _session_url(session_no)
+    r = CLIENT.patch(url, json=updatelist)
+    _parse_write(url, r, session_no)
 
 def post_issues(session_no: str, issues: list[dict]) -> None:
-    url = f"{CONFIG.ASSET_SESSION_URL}/session_no={session_no}/im_session_issue"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=issues)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise SessionUncaughtError(session_no, err)
\ No newline at end of file
+    url = _issues_url(session_no)
+    r = CLIENT.post(url, json=issues)
+    _parse_write(url, r, session_no)
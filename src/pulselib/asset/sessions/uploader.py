@@ -0,0 +1,94 @@
+import time
+from dataclasses import dataclass
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ...config import CONFIG
+from . import session_requests
+from .operations import _gen_tc_events, _replace_session_in_issues
+
+
+@dataclass
+class ChunkResult:
+    index: int
+    start: int
+    count: int
+    attempts: int = 0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.attempts > 0 and not self.error
+
+@dataclass
+class UploadResults:
+    session_no: str
+    chunks: list[ChunkResult]
+
+    @property
+    def posted(self) -> int:
+        return sum(chunk.count for chunk in self.chunks if chunk.ok)
+
+    @property
+    def errors(self) -> list[str]:
+        return [f"Chunk {chunk.index} ({chunk.start}-{chunk.start+chunk.count-1}): {chunk.error}"
+                for chunk in self.chunks if not chunk.ok]
+
+# Called once per chunk attempt with (chunk, finished chunks, total chunks)
+ProgressCallback = Callable[[ChunkResult, int, int], None]
+
+
+def _post_chunk(session_no: str, issues: list[dict], chunk: ChunkResult) -> ChunkResult:
+    chunk.attempts += 1
+    try:
+        session_requests.post_issues(session_no, issues[chunk.start:chunk.start+chunk.count])
+    except Exception as e:
+        chunk.error = f"{type(e).__name__}: {e}"
+    else:
+        chunk.error = ""
+    return chunk
+
+def upload_issues(session_no: str, issues: list[dict], chunk_size: int | None = None,
+                  max_workers: int | None = None, retries: int = 2, retry_delay: float = 1.0,
+                  progress: ProgressCallback | None = None) -> UploadResults:
+    """
+    Chunked version of session_requests.post_issues.
+    Chunks are posted concurrently over the shared client, failed chunks are retried
+    up to retries more times. A chunk that failed on a read timeout may still have been
+    written by the server, so a retry can duplicate its issues.
+    issues are copied before session_no is set on them, the caller's dicts are left untouched.
+    """
+    chunk_size = chunk_size if chunk_size is not None else CONFIG.ISSUE_CHUNK_SIZE
+    if chunk_size < 1:
+        raise ValueError(f"upload_issues: chunk_size must be at least 1: {chunk_size}")
+    # shallow copies, only top-level keys are rewritten
+    issues = [dict(issue) for issue in issues]
+    _replace_session_in_issues(issues, session_no)
+    chunks = [ChunkResult(index, start, min(chunk_size, len(issues) - start))
+              for index, start in enumerate(range(0, len(issues), chunk_size))]
+    results = UploadResults(session_no, chunks)
+    if not chunks:
+        return results
+
+    workers = max_workers if max_workers is not None else CONFIG.ISSUE_UPLOAD_WORKERS
+    pending = chunks
+    finished = 0
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for attempt in range(retries + 1):
+            if attempt > 0:
+                time.sleep(retry_delay * attempt)
+            futures = [executor.submit(_post_chunk, session_no, issues, chunk) for chunk in pending]
+            for future in as_completed(futures):
+                chunk = future.result()
+                if chunk.ok:
+                    finished += 1
+                if progress is not None:
+                    progress(chunk, finished, len(chunks))
+            pending = [chunk for chunk in pending if not chunk.ok]
+            if not pending:
+                break
+    return results
+
+def upload_tc_events(session_no: str, tcs: list[tuple[str, str]], **kwargs) -> UploadResults:
+    """ Chunked version of operations.post_tc_events, kwargs are passed to upload_issues """
+    return upload_issues(session_no, _gen_tc_events(tcs), **kwargs)
@@ -6,9 +6,10 @@ import tclib3
 import mediaprobe
 from mediaprobe import MediaProbe
 
-from ... import RosettaPath
+from rosettapath import RosettaPath
 
 from .assetfieldmaps import ASSET_FIELD_MAPS
+from .tracks import TrackIndex, index_tracks, first_track
 
 if TYPE_CHECKING:
     from ..fieldmaps import SimpleFieldMap
@@ -36,6 +37,9 @@ class SpecInfo:
     def makejdict(self) -> dict:
         return self.mapping.makejdict(self._format(self.mpulse_value))
 
+    def changed(self, jdict: dict) -> bool:
+        return not self.mapping.matches(jdict, self._format(self.mpulse_value))
+
     def _format(self, value: str | bool) -> str | bool:
         if not value:
             return value
@@ -121,6 +125,8 @@ class SpecInterface:
         self.path: str
         self.set_path(path)
         self.all: list[SpecInfo] = self._create_specinfo()
+        self.byname: dict[str, SpecInfo] = {specinfo.name.lower(): specinfo for specinfo in self.all}
+        self.tracks: TrackIndex = {}
         self.found: list[SpecInfo] = []
         self.notfound: list[SpecInfo] = []
         self._isprobed = False
@@ -136,6 +142,7 @@ class SpecInterface:
         self.path = RosettaPath(path.replace("\"", "")).linux_path()
 
     def probefile(self, probe: "MediaProbe") -> None:
+        self.tracks = index_tracks(probe)
         for specinfo in self.all:
             if specinfo.probetype == "simple":
                 self._simple_lookup(specinfo, probe)
@@ -149,14 +156,15 @@ class SpecInterface:
     def get_spec(self, spec: str) -> SpecInfo | None:
         if not self.isprobed:
             raise RuntimeError("SpecInterface.get_spec: probe() must be called before get_spec()")
-        for specinfo in self.all:
-            if specinfo.name.lower() == spec.lower():
-                return specinfo
+        return self.byname.get(spec.lower())
 
-    def patch_ops(self) -> list[dict]:
+    def patch_ops(self, current: dict | None = None) -> list[dict]:
+        """ current: the asset's jdict, only fields that differ from it are included """
         if not self.isprobed:
             raise RuntimeError("SpecInterface.patch_ops: probe() must be called before patch_ops()")
-        return [specinfo.patch_op() for specinfo in self.all]
+        if current is None:
+            return [specinfo.patch_op() for specinfo in self.all]
+        return [specinfo.patch_op() for specinfo in self.all if specinfo.changed(current)]
 
     def makejdict(self) -> dict:
         if not self.isprobed:
@@ -184,18 +192,15 @@ class SpecInterface:
         self.notfound.append(specinfo)
 
     def _simple_lookup(self, specinfo: SpecInfo, probe: "MediaProbe") -> None:
-        for track in probe.fulljson["tracks"]:
-            if track["@type"] == specinfo.minfo_track:
-                value = track.get(specinfo.minfo_field)
-                if value:
-                    specinfo.minfo_value = value
-                    specinfo.mpulse_value = value
-                    specinfo.found = True
-                    self._add_found(specinfo)
-                else:
-                    self._add_notfound(specinfo)
-                return
-        self._add_notfound(specinfo)
+        track = first_track(self.tracks, specinfo.minfo_track)
+        value = track.get(specinfo.minfo_field) if track is not None else None
+        if value:
+            specinfo.minfo_value = value
+            specinfo.mpulse_value = value
+            specinfo.found = True
+            self._add_found(specinfo)
+        else:
+            self._add_notfound(specinfo)
 
     def _dict_lookup(self, specinfo: SpecInfo, probe: "MediaProbe") -> None:
         self._simple_lookup(specinfo, probe)
@@ -230,10 +235,9 @@ class SpecInterface:
 
     def _container_spec(self, specinfo: SpecInfo, probe: "MediaProbe") -> None:
         specinfo.mpulse_value = Path(probe.filepath).suffix[1:].upper()
-        for track in probe.fulljson["tracks"]:
-            if track["@type"] == "General":
-                specinfo.minfo_value = track.get("Format", "")
-                break
+        track = first_track(self.tracks, "General")
+        if track is not None:
+            specinfo.minfo_value = track.get("Format", "")
         self._add_found(specinfo)
             
     def _length_spec(self, specinfo: SpecInfo, probe: "MediaProbe") -> None:
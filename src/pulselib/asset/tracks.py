@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mediaprobe import MediaProbe
+
+TrackIndex = dict[str, list[dict]]
+
+
+def index_tracks(probe: "MediaProbe") -> TrackIndex:
+    """ Groups the probe's MediaInfo tracks by @type, keeping their original order """
+    index: TrackIndex = {}
+    for track in probe.fulljson["tracks"]:
+        index.setdefault(track["@type"], []).append(track)
+    return index
+
+def first_track(index: TrackIndex, tracktype: str) -> dict | None:
+    tracks = index.get(tracktype)
+    return tracks[0] if tracks else None
@@ -0,0 +1,99 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast after failure_threshold consecutive failures.
+    Once reset_timeout seconds have passed a single trial call is let through (half open),
+    its outcome closes the circuit again or reopens it.
+    onopen builds the exception raised for rejected calls from the breaker name.
+    """
+    def __init__(self, name: str, onopen: Callable[[str], Exception],
+                 failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self.onopen = onopen
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._counts = {"calls": 0, "successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+        self._last_error = ""
+        self._last_failure = 0.0
+        self._last_latency = 0.0
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+            if self.state == OPEN or (self.state == HALF_OPEN and self._trial_running):
+                self._counts["rejected"] += 1
+                raise self.onopen(self.name)
+            if self.state == HALF_OPEN:
+                self._trial_running = True
+            self._counts["calls"] += 1
+
+    def _success(self, latency: float) -> None:
+        with self._lock:
+            self._counts["successes"] += 1
+            self._consecutive_failures = 0
+            self._last_latency = latency
+            self._trial_running = False
+            self.state = CLOSED
+
+    def _failure(self, err: Exception) -> None:
+        with self._lock:
+            self._counts["failures"] += 1
+            self._consecutive_failures += 1
+            self._last_error = f"{type(err).__name__}: {err}"
+            self._last_failure = time.time()
+            self._trial_running = False
+            if self.state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self._counts["opened"] += 1
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """ Any Exception raised inside counts as a failure of the guarded service """
+        self._admit()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._failure(e)
+            raise
+        except BaseException:
+            with self._lock:
+                self._trial_running = False
+            raise
+        else:
+            self._success(time.monotonic() - start)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self._consecutive_failures = 0
+            self._trial_running = False
+
+    def metrics(self) -> dict[str, str | int | float]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self.state,
+                "consecutive_failures": self._consecutive_failures,
+                **self._counts,
+                "last_error": self._last_error,
+                "last_failure": self._last_failure,
+                "last_latency": self._last_latency,
+            }
@@ -0,0 +1,66 @@
+import time
+import threading
+from typing import Any, Callable, Generic, TypeVar, Hashable, Iterable
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Minimal thread-safe in-memory cache where every entry expires
+    ttl seconds after it was stored. A ttl of None never expires.
+    keyfunc: normalises every key passed in (e.g. str, so 123 and "123" are the same entry).
+    """
+    def __init__(self, ttl: float | None = None, keyfunc: Callable[[Any], K] | None = None) -> None:
+        self.ttl = ttl
+        self.keyfunc = keyfunc
+        self._data: dict[K, tuple[float, V]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, key: Any) -> K:
+        return key if self.keyfunc is None else self.keyfunc(key)
+
+    def _expired(self, stored: float) -> bool:
+        if self.ttl is None:
+            return False
+        return time.monotonic() - stored > self.ttl
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        key = self._key(key)
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            stored, value = entry  # type: ignore
+            if self._expired(stored):
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        key = self._key(key)
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+
+    def update(self, items: Iterable[tuple[K, V]]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key, value in items:
+                self._data[self._key(key)] = (now, value)
+
+    def invalidate(self, key: K | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(self._key(key), None)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -1,11 +1,16 @@
 import re
 from datetime import datetime
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TypeVar, TYPE_CHECKING, Union
+from typing import TypeVar, TYPE_CHECKING, Union, Sequence, Callable, Hashable
 
 from . import ReportEnum
+from ..config import CONFIG
 from ..job import job_requests
-from ..trx import Transaction, Personnel, Room, SAN, Equipment
+from ..trx import Transaction, TransactionGroup, Personnel, Room, SAN, Equipment
+from ..resource.directory import ResourceDirectory
+from ..resource.resourcefiledmaps import RESOURCE_SLIM_COLUMNS
 from .. import PERSONNEL_GROUPS, ROOM_GROUPS, SAN_GROUPS, SAG_GROUPS, SAG_GROUPS_ROOMS
 
 if TYPE_CHECKING:
@@ -23,6 +28,10 @@ CALLSHEET_PERSONNEL = PERSONNEL_GROUPS[:]
 CALLSHEET_PERSONNEL.remove("QC Operators")
 CALLSHEET_PERSONNEL.remove("Encoding & Packaging")
 
+# Callsheets only read Resource fields, so their lookups fetch just those columns.
+# Kept apart from resource.directory.RESOURCE_DIRECTORY, which caches full records.
+CALLSHEET_RESOURCES = ResourceDirectory(columns=RESOURCE_SLIM_COLUMNS)
+
 
 @dataclass
 class DataRow:
@@ -30,20 +39,34 @@ class DataRow:
     is_actor: bool = False
     is_wo_header: bool = False
 
+    @property
+    def date_format(self) -> str:
+        return "%m/%d/%Y %I:%M%p" if self.is_wo_header else "%I:%M%p"
+
+    @cached_property
+    def sortkey(self) -> datetime:
+        # Parsed on first use so only rows that actually get sorted pay for strptime.
+        # Rows without a date in data[1] (e.g. "Order No: ...") raise, and nothing is cached.
+        return datetime.strptime(self.data[1], self.date_format)
+
+    def get_sortkey(self) -> datetime:
+        return self.sortkey
+
+    @property
+    def identity(self) -> tuple[str, ...]:
+        return tuple(self.data)
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, DataRow):
             return self.data == other.data
         return False
+
+    def __hash__(self) -> int:
+        return hash(self.identity)
     
     def __lt__(self, other: "DataRow") -> bool:
         if isinstance(other, DataRow):
-            if self.is_wo_header:
-                format = "%m/%d/%Y %I:%M%p"
-            else:
-                format = "%I:%M%p"
-            date1 = datetime.strptime(self.data[1], format)
-            date2 = datetime.strptime(other.data[1], format)
-            return date1 < date2
+            return self.get_sortkey() < other.get_sortkey()
         raise TypeError(f"Cannot compare DataRow to {type(other)}")
 
 @dataclass
@@ -53,17 +76,30 @@ class WorkOrderBlock:
     is_actors: bool = False
     is_maintenance: bool = False
 
+    @property
+    def sort_row(self) -> DataRow:
+        return self.header_rows[0 if self.is_maintenance else 1]
+
+    def sortkey(self) -> datetime:
+        return self.sort_row.get_sortkey()
+
+    @property
+    def identity(self) -> tuple[tuple[tuple[str, ...], ...], tuple[tuple[str, ...], ...]]:
+        return (tuple(row.identity for row in self.header_rows),
+                tuple(row.identity for row in self.data_rows))
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, WorkOrderBlock):
             return (self.header_rows == other.header_rows and
                     self.data_rows == other.data_rows)
         return False
+
+    def __hash__(self) -> int:
+        return hash(self.identity)
     
     def __lt__(self, other: "WorkOrderBlock") -> bool:
         if isinstance(other, WorkOrderBlock):
-            row_a = 0 if self.is_maintenance else 1
-            row_b = 0 if other.is_maintenance else 1
-            return self.header_rows[row_a] < other.header_rows[row_b]
+            return self.sortkey() < other.sortkey()
         raise TypeError(f"Cannot compare WorkOrderBlock to {type(other)}")
 
 class TopLevelBlock:
@@ -134,17 +170,29 @@ class JobGroup:
                 )
             )
 
-    def pull_project_manager(self, refresh: bool=False) -> None:
-        if self.project_manager is not None and not refresh:
-            return
-        job_jdict = job_requests.get(self.job_num)
+    @property
+    def identity(self) -> tuple[str, str]:
+        # ResourceGroups.jobgroups() creates exactly one JobGroup per (job_num, job_desc)
+        return (self.job_num, self.job_desc)
+
+    def __hash__(self) -> int:
+        return hash(self.identity)
+
+    @staticmethod
+    def get_project_manager(job_num: str) -> str:
+        job_jdict = job_requests.get(job_num)
         sales_office_dict = job_jdict.get("sale_office_no")
         if sales_office_dict is None:
-            raise ValueError(f"Job does not have a sales office dict in json response: {self.job_num}")
+            raise ValueError(f"Job does not have a sales office dict in json response: {job_num}")
         pm_no = sales_office_dict.get("sale_office_no")
         if pm_no is None:
-            raise ValueError(f"Sales office dict does not have a sale_office_no in Job: {self.job_num}")
-        self.project_manager = job_requests.get_project_manager_desc(pm_no)
+            raise ValueError(f"Sales office dict does not have a sale_office_no in Job: {job_num}")
+        return job_requests.get_project_manager_desc(pm_no)
+
+    def pull_project_manager(self, refresh: bool=False) -> None:
+        if self.project_manager is not None and not refresh:
+            return
+        self.project_manager = self.get_project_manager(self.job_num)
 
 
 class RoomGroup:
@@ -185,10 +233,13 @@ class RoomGroup:
     def _get_datetime(self, date: str) -> datetime:
         return datetime.strptime(date, "%Y-%m-%dT%H:%M:%S")
 
-    def _remove_duplicates(self, data: list[T]) -> list[T]:
+    def _remove_duplicates(self, data: list[T], key: Callable[[T], Hashable]) -> list[T]:
+        seen: set[Hashable] = set()
         no_dupes = []
         for item in data:
-            if item not in no_dupes:
+            identity = key(item)
+            if identity not in seen:
+                seen.add(identity)
                 no_dupes.append(item)
         return no_dupes
 
@@ -238,7 +289,7 @@ class RoomGroup:
         return False
     
     def _personnel_table_rows(self, workgroup: WorkorderGroup) -> list[list[str]]:
-        cleandata = self._remove_duplicates(workgroup.personnel)
+        cleandata = self._remove_duplicates(workgroup.personnel, key=lambda trx: trx.identity)
         san = workgroup.sans[0].name if workgroup.sans else ""
         rows = []
         for person in cleandata:
@@ -476,9 +527,19 @@ class RoomGroup:
 
         return WorkOrderBlock(header_rows, data_rows)
 
-    def pull_project_managers(self) -> None:
+    def pull_project_managers(self, max_workers: int | None = None) -> None:
+        pending: dict[str, list[JobGroup]] = {}
         for jobgroup in self.jobgroups:
-            jobgroup.pull_project_manager()
+            if jobgroup.project_manager is None:
+                pending.setdefault(jobgroup.job_num, []).append(jobgroup)
+        if not pending:
+            return
+        workers = max_workers if max_workers is not None else CONFIG.MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            managers = executor.map(JobGroup.get_project_manager, pending)
+            for job_num, project_manager in zip(pending, managers):
+                for jobgroup in pending[job_num]:
+                    jobgroup.project_manager = project_manager
     
     def add_roster_time_offs(self, roster_time_offs: list["RosterTimeOff"]) -> None:
         self._roster_time_offs += roster_time_offs
@@ -502,8 +563,8 @@ class RoomGroup:
                             continue
                     blocks.append(block_method(jobgroup, actorgroup, self.room_trx))
         blocks.extend(self.roster_time_off_blocks(self._roster_time_offs))
-        blocks.sort()
-        return self._remove_duplicates(blocks)
+        blocks.sort(key=WorkOrderBlock.sortkey)
+        return self._remove_duplicates(blocks, key=lambda block: block.identity)
     
     def workordergroups(self) -> list[WorkorderGroup]:
         worders = []
@@ -525,8 +586,9 @@ class RoomGroup:
 
 
 class ResourceGroups:
-    def __init__(self, transactions: list[Transaction]):
+    def __init__(self, transactions: list[Transaction], directory: ResourceDirectory | None = None):
         self.trxlist = transactions
+        self.directory = directory if directory is not None else CALLSHEET_RESOURCES
         self.personnel: list[Personnel] = []
         self.sag_actors: list[Personnel] = []
         self.rooms: list[Room] = []
@@ -534,6 +596,8 @@ class ResourceGroups:
         self.equipment: list[Equipment] = []
         self.other: dict[str, list[Transaction]] = {}
         self._split_into_groups()
+        self._wo_index = self._build_indexes(byjob=False)
+        self._job_index = self._build_indexes(byjob=True)
 
     def _split_into_groups(self) -> None:
         # temp dicts to avoid multiple objects with same name
@@ -543,8 +607,9 @@ class ResourceGroups:
         sans: dict[str, list[Transaction]] = {}
         equipment: dict[str, list[Transaction]] = {}
 
+        self.directory.load(trx.name for trx in self.trxlist)
         for trx in self.trxlist:
-            resource = trx.get_resource()
+            resource = trx.get_resource(self.directory)
             if resource is None:
                 raise ValueError(f"Transaction does not have a resource: {trx.name}")
             if resource.type.lower() == "equipment":
@@ -568,36 +633,36 @@ class ResourceGroups:
         self.sans = [SAN(name, trxlist) for name, trxlist in sans.items()]
         self.equipment = [Equipment(name, trxlist) for name, trxlist in equipment.items()]
 
+    def _build_indexes(self, byjob: bool) -> dict[str, dict[str, list[Transaction]]]:
+        groups: dict[str, Sequence[TransactionGroup]] = {
+            "personnel": self.personnel,
+            "actors": self.sag_actors,
+            "sans": self.sans,
+            "equipment": self.equipment
+        }
+        indexes: dict[str, dict[str, list[Transaction]]] = {}
+        for category, resources in groups.items():
+            index: dict[str, list[Transaction]] = {}
+            for resource in resources:
+                for trx in resource.trxlist:
+                    key = trx.job if byjob else trx.wo
+                    index.setdefault(key, []).append(trx)
+            indexes[category] = index
+        return indexes
+
+    def _search_index(self, category: str, wo_or_job: str, byjob: bool) -> list[Transaction]:
+        index = self._job_index if byjob else self._wo_index
+        # copy so callers (e.g. WorkorderGroup sorting personnel) can't mutate the index
+        return list(index[category].get(wo_or_job, []))
+
     def _search_equipment(self, wo_or_job: str, byjob:bool = False) -> list[Transaction]:
-        equipment: list[Transaction] = []
-        for equip in self.equipment:
-            for trx in equip.trxlist:
-                if byjob and trx.job == wo_or_job:
-                    equipment.append(trx)
-                elif not byjob and trx.wo == wo_or_job:
-                    equipment.append(trx)
-        return equipment
+        return self._search_index("equipment", wo_or_job, byjob)
 
     def _search_sans(self, wo_or_job: str, byjob:bool = False) -> list[Transaction]:
-        sans: list[Transaction] = []
-        for san in self.sans:
-            for trx in san.trxlist:
-                if byjob and trx.job == wo_or_job:
-                    sans.append(trx)
-                elif not byjob and trx.wo == wo_or_job:
-                    sans.append(trx)
-        return sans
+        return self._search_index("sans", wo_or_job, byjob)
 
     def _search_personnel(self, wo_or_job: str, byjob:bool = False, actors: bool=False) -> list[Transaction]:
-        personlist = self.sag_actors if actors else self.personnel
-        personnel: list[Transaction] = []
-        for person in personlist:
-            for trx in person.trxlist:
-                if byjob and trx.job == wo_or_job:
-                    personnel.append(trx)
-                elif not byjob and trx.wo == wo_or_job:
-                    personnel.append(trx)
-        return personnel
+        return self._search_index("actors" if actors else "personnel", wo_or_job, byjob)
     
     def jobgroups(self) -> list[JobGroup]:
         jobdict: dict[tuple[str, str], list[WorkorderGroup]] = {}
@@ -625,12 +690,15 @@ class ResourceGroups:
     def roomgroups(self) -> list[RoomGroup]:
         jobgroups = self.jobgroups()
         roomdict: dict[str, tuple[Transaction, list[JobGroup]]] = {}
+        seen: set[tuple[str, tuple[str, str]]] = set()
         for jobgroup in jobgroups:
             for workgroup in jobgroup.workordergroups:
                 if workgroup.room_trx is None:
                     raise ValueError(f"Workorder group must have a room transaction: {workgroup.wo_num}")
-                jobgroups_by_room = roomdict.setdefault(workgroup.room_trx.name, (workgroup.room_trx, []))
-                if jobgroup not in jobgroups_by_room[1]:
+                room_name = workgroup.room_trx.name
+                jobgroups_by_room = roomdict.setdefault(room_name, (workgroup.room_trx, []))
+                if (room_name, jobgroup.identity) not in seen:
+                    seen.add((room_name, jobgroup.identity))
                     jobgroups_by_room[1].append(jobgroup)
         room_groups = [RoomGroup(trx, jobgroups) for trx, jobgroups in roomdict.values()]
         room_groups.sort(key=lambda x: x.room_trx.name)
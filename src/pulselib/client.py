@@ -0,0 +1,119 @@
+import time
+import weakref
+from typing import Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import CONFIG
+from .errors import RequestAppliedError
+from .governor import GOVERNOR, Governor
+from .retry import RetryPolicy
+
+
+class Client:
+    """
+    Shared HTTP client for the Mediapulse REST API.
+    Owns a keep-alive connection pool so consecutive calls reuse
+    the same TCP connections instead of reconnecting every time.
+    Connection errors and 5xx responses are retried according to retry_policy,
+    every attempt waits for a slot from the governor.
+    A stream=True response keeps its slot until it's closed (utils.iter_json_array closes it).
+    """
+    def __init__(self, auth: tuple[str, str] | None = None,
+                 timeout: tuple[float, float] | None = None,
+                 pool_size: int | None = None,
+                 headers: dict[str, str] | None = None,
+                 retry_policy: RetryPolicy | None = None,
+                 governor: Governor | None = None) -> None:
+        self.auth = auth if auth is not None else (CONFIG.USERNAME, CONFIG.PASSWORD)
+        self.timeout = timeout if timeout is not None else CONFIG.MP_TIMEOUT
+        self.pool_size = pool_size if pool_size is not None else CONFIG.MP_POOL_SIZE
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.governor = governor if governor is not None else GOVERNOR
+        self.headers = {"Accept": "application/json"}
+        if headers is not None:
+            self.headers.update(headers)
+        self.session = self._new_session()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.auth = self.auth
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def request(self, method: str, url: str, retry: bool | None = None,
+                precheck: Callable[[], bool] | None = None, **kwargs: Any) -> requests.Response:
+        """
+        retry: overrides the policy's idempotent method default.
+        precheck: called before every retry, returning True means the failed attempt
+        already took effect and RequestAppliedError is raised instead of resending.
+        Only getting the response (status and headers) is retried. With stream=True the body
+        is read later by the caller, a connection reset at that point is raised, not retried.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        policy = self.retry_policy
+        retries = policy.retries if policy.should_retry(method, retry) else 0
+        stream = kwargs.get("stream", False)
+        attempt = 0
+        while True:
+            release = self.governor.acquire(url)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                release()
+                if attempt >= retries:
+                    raise
+            except BaseException:
+                release()
+                raise
+            else:
+                if attempt >= retries or response.status_code not in policy.retry_statuses:
+                    if stream:
+                        _release_on_close(response, release)
+                    else:
+                        release()
+                    return response
+                response.close()
+                release()
+            attempt += 1
+            time.sleep(policy.delay(attempt))
+            if precheck is not None and precheck():
+                raise RequestAppliedError(method, url)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, json: Any = None, **kwargs: Any) -> requests.Response:
+        """ Not retried unless retry=True, preferably with a precheck """
+        return self.request("POST", url, json=json, **kwargs)
+
+    def patch(self, url: str, json: Any = None, **kwargs: Any) -> requests.Response:
+        return self.request("PATCH", url, json=json, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def reset(self) -> None:
+        self.session.close()
+        self.session = self._new_session()
+
+
+def _release_on_close(response: requests.Response, release: Callable[[], None]) -> None:
+    """ The body of a streamed response is still being read, its governor slot goes back on close() """
+    close = response.close
+
+    def close_and_release() -> None:
+        try:
+            close()
+        finally:
+            release()
+    response.close = close_and_release  # type: ignore[method-assign]
+    # a response dropped without being closed still returns its slot
+    weakref.finalize(response, release)
+
+
+CLIENT = Client()
@@ -1,5 +1,6 @@
 import os
-from dataclasses import dataclass
+from pathlib import Path
+from dataclasses import dataclass, field
 
 @dataclass
 class Config:
@@ -11,6 +12,34 @@ class Config:
     MP_DEBUG: bool = False
     MP_DEBUG_INFO: tuple[str, str] = ("11001", "REI_TEST")
     MP_LIVE_INFO: tuple[str, str] = ("11000", "REI_LIVE")
+    MP_TIMEOUT: tuple[float, float] = (10.0, 300.0)
+    MP_POOL_SIZE: int = 20
+    MP_RETRIES: int = 3
+    MP_BACKOFF: float = 0.5
+    MP_BACKOFF_MAX: float = 10.0
+    # (requests per second, burst, max in flight) keyed by *_URL field name, GLOBAL or DEFAULT. See governor.Governor
+    MP_RATE_LIMITS: dict[str, tuple[float | None, int, int | None]] = field(default_factory=lambda: {
+        "GLOBAL": (None, 1, 24),
+        "DEFAULT": (20.0, 20, 12),
+        "TRX_QUERY_URL": (2.0, 4, 4),
+        "ROSTER_QUERY_URL": (4.0, 4, 4),
+        "RESOURCE_QUERY_URL": (4.0, 4, 4),
+        "ASSET_QUERY_URL": (10.0, 10, 8),
+    })
+    AIO_MAX_CONCURRENCY: int = 20
+    MAX_WORKERS: int = 8
+    RESOURCE_CACHE_TTL: float = 900.0
+    SALES_OFFICE_REFRESH: float = 3600.0
+    ASSET_CACHE_TTL: float = 300.0
+    ISSUE_CHUNK_SIZE: int = 250
+    ISSUE_UPLOAD_WORKERS: int = 4
+    MEDIAINFO_TIMEOUT: tuple[float, float] = (5.0, 120.0)
+    PROBE_BREAKER_THRESHOLD: int = 5
+    PROBE_BREAKER_RESET: float = 30.0
+    # Mount points of the media volumes, files under an unmounted root are probed instead of stat'ed.
+    # No default, the mounts differ per host. Empty disables local "file missing" answers (see probe.local_exists)
+    VOLUME_ROOTS: tuple[str, ...] = ()
+    PROBE_CACHE_DIR: str = str(Path.home() / ".cache" / "pulselib")
     MEDIAINFO_URL: str = "http://10.0.20.96:PORT/api/probe"
     TRX_QUERY_URL: str = "http://xytechapp01:PORT/api/v1/database/DATABASE/JmTrxList"
     JOB_URL: str = "http://xytechapp01:PORT/api/v1/database/DATABASE/JmJob"
@@ -41,6 +70,12 @@ class Config:
             self.PASSWORD = pwd
         else:
             raise ValueError("MP_PASSWORD environment variable not set")
+        cache_dir = os.getenv('PULSELIB_CACHE_DIR')
+        if cache_dir is not None:
+            self.PROBE_CACHE_DIR = cache_dir
+        volume_roots = os.getenv('PULSELIB_VOLUME_ROOTS')
+        if volume_roots is not None:
+            self.VOLUME_ROOTS = tuple(root for root in volume_roots.split(os.pathsep) if root)
         mp_port = self.MP_DEBUG_INFO[0] if self.MP_DEBUG else self.MP_LIVE_INFO[0]
         mp_db = self.MP_DEBUG_INFO[1] if self.MP_DEBUG else self.MP_LIVE_INFO[1]
         mi_port = self.MI_DEBUG_PORT if self.MI_DEBUG else self.MI_LIVE_PORT
@@ -1,3 +1,14 @@
+class RequestAppliedError(Exception):
+    """ A retried request's precheck found that a failed attempt had already taken effect """
+    def __init__(self, method: str, url: str):
+        super().__init__(f"{method} {url}: earlier attempt already applied, not retried")
+
+
+class ProbeServiceUnavailableError(ConnectionError):
+    def __init__(self, name: str):
+        super().__init__(f"{name}: circuit open, MediaInfo service is failing, not sending request")
+
+
 class AlertUncaughtError(Exception):
     def __init__(self, err: str):
         super().__init__(f"alert_requests: Uncaught error - {err}")
@@ -61,6 +61,27 @@ class SimpleFieldMap:
             case _:
                 raise NotImplementedError(f"SimpleFieldMap.patch: {self.ftype}")
 
+    def matches(self, jdict: dict[str, Any], value: Any) -> bool:
+        """ True if patch_op(value) would leave jdict unchanged """
+        try:
+            current = self.read(jdict)
+        except KeyError:
+            return False
+        match self.ftype:
+            case FieldTypeEnum.STRING:
+                return (current or "") == ("" if value is None else str(value))
+            case FieldTypeEnum.NUMBER:
+                try:
+                    return current is not None and float(current) == float(value)
+                except (TypeError, ValueError):
+                    return False
+            case FieldTypeEnum.CHECKMARK:
+                return current == bool(value)
+            case FieldTypeEnum.MPULSE_ENUM:
+                return (current or "") == (value or "")
+            case _:
+                return current == value
+
     def makejdict(self, value: Any) -> dict[str, Any]:
         match self.ftype:
             case FieldTypeEnum.STRING | FieldTypeEnum.NUMBER | FieldTypeEnum.LIST:
@@ -133,4 +154,17 @@ class SimpleFieldMap:
             return self._jdict_single("", self.keys[0])
         if value not in self.enumdict:
             raise ValueError(f"SimpleFieldMap - {self.name} - enum value not in enumdict: {value}")
-        return self._jdict_single(self.enumdict[value], self.keys[0])
\ No newline at end of file
+        return self._jdict_single(self.enumdict[value], self.keys[0])
+
+
+def result_columns(fieldmaps: dict[str, SimpleFieldMap], *extra: str) -> list[str]:
+    """ Top-level record keys read by the given field maps, for use as a list query projection """
+    columns: list[str] = []
+    for fieldmap in fieldmaps.values():
+        key = fieldmap.keys if isinstance(fieldmap.keys, str) else fieldmap.keys[0]
+        if key not in columns:
+            columns.append(key)
+    for key in extra:
+        if key not in columns:
+            columns.append(key)
+    return columns
@@ -0,0 +1,204 @@
+import time
+import asyncio
+import threading
+from dataclasses import dataclass
+from contextlib import contextmanager, asynccontextmanager
+from typing import AsyncIterator, Callable, Iterator
+
+from .config import CONFIG
+
+GLOBAL_FAMILY = "GLOBAL"
+DEFAULT_FAMILY = "DEFAULT"
+
+
+@dataclass(frozen=True)
+class Limit:
+    """ rate: requests per second (None is unlimited), burst: token bucket size """
+    rate: float | None = None
+    burst: int = 1
+    max_in_flight: int | None = None
+
+
+class Gate:
+    """
+    Token bucket plus max-in-flight counter for one endpoint family.
+    State is guarded by a threading lock so threads and any number of event loops can share it.
+    """
+    def __init__(self, name: str, limit: Limit) -> None:
+        self.name = name
+        self.limit = limit
+        self.in_flight = 0
+        self.waiting = 0
+        self._tokens = float(limit.burst)
+        self._refilled = time.monotonic()
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def _refill(self) -> None:
+        """ Caller holds the lock """
+        if self.limit.rate is not None:
+            now = time.monotonic()
+            self._tokens = min(float(self.limit.burst), self._tokens + (now - self._refilled) * self.limit.rate)
+            self._refilled = now
+
+    def _try_acquire(self) -> float | None:
+        """ Caller holds the lock. Returns None when acquired, else seconds to wait (-1 waits for a release) """
+        limit = self.limit
+        if limit.max_in_flight is not None and self.in_flight >= limit.max_in_flight:
+            return -1
+        if limit.rate is not None:
+            self._refill()
+            if self._tokens < 1:
+                return (1 - self._tokens) / limit.rate
+            self._tokens -= 1
+        self.in_flight += 1
+        return None
+
+    def acquire(self) -> None:
+        with self._cond:
+            self.waiting += 1
+            try:
+                while (wait := self._try_acquire()) is not None:
+                    self._cond.wait(timeout=None if wait < 0 else wait)
+            finally:
+                self.waiting -= 1
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.waiting += 1
+        try:
+            while True:
+                future = None
+                with self._lock:
+                    wait = self._try_acquire()
+                    if wait is None:
+                        return
+                    if wait < 0:
+                        future = loop.create_future()
+                        self._async_waiters.append((loop, future))
+                if future is not None:
+                    await future
+                else:
+                    await asyncio.sleep(wait)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # loop already closed
+                pass
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            self._refill()
+            return {"waiting": self.waiting, "in_flight": self.in_flight, "tokens": self._tokens}
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+def _release_once(*gates: Gate) -> Callable[[], None]:
+    lock = threading.Lock()
+    released = False
+
+    def release() -> None:
+        nonlocal released
+        with lock:
+            if released:
+                return
+            released = True
+        for gate in gates:
+            gate.release()
+    return release
+
+
+class Governor:
+    """
+    Client-side rate limiting for the Mediapulse API.
+    Every request passes the GLOBAL gate and the gate of its endpoint family,
+    a family being the name of the CONFIG *_URL the request url starts with (e.g. "TRX_QUERY_URL").
+    Families without their own limit share the DEFAULT gate.
+    """
+    def __init__(self, limits: dict[str, Limit] | None = None) -> None:
+        if limits is None:
+            limits = {name: Limit(*limit) for name, limit in CONFIG.MP_RATE_LIMITS.items()}
+        limits = dict(limits)
+        limits.setdefault(GLOBAL_FAMILY, Limit())
+        limits.setdefault(DEFAULT_FAMILY, Limit())
+        self.gates = {name: Gate(name, limit) for name, limit in limits.items()}
+        prefixes = {value: key for key, value in vars(CONFIG).items()
+                    if key.endswith("_URL") and isinstance(value, str)}
+        self._prefixes = sorted(prefixes.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def family(self, url: str) -> str:
+        for prefix, name in self._prefixes:
+            if url.startswith(prefix):
+                return name
+        return DEFAULT_FAMILY
+
+    def _gates(self, url: str) -> tuple[Gate, Gate]:
+        gate = self.gates.get(self.family(url), self.gates[DEFAULT_FAMILY])
+        return (gate, self.gates[GLOBAL_FAMILY])
+
+    def acquire(self, url: str) -> Callable[[], None]:
+        """
+        Blocks until url's family and the GLOBAL gate both have a slot.
+        Returns the function that gives the slot back, calling it again is a no-op.
+        For slots that outlive a with block, e.g. until a streamed response is closed.
+        """
+        family, shared = self._gates(url)
+        family.acquire()
+        try:
+            shared.acquire()
+        except BaseException:
+            family.release()
+            raise
+        return _release_once(shared, family)
+
+    async def acquire_async(self, url: str) -> Callable[[], None]:
+        family, shared = self._gates(url)
+        await family.acquire_async()
+        try:
+            await shared.acquire_async()
+        except BaseException:
+            family.release()
+            raise
+        return _release_once(shared, family)
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        release = self.acquire(url)
+        try:
+            yield
+        finally:
+            release()
+
+    @asynccontextmanager
+    async def aslot(self, url: str) -> AsyncIterator[None]:
+        release = await self.acquire_async(url)
+        try:
+            yield
+        finally:
+            release()
+
+    def queue_depth(self, family: str | None = None) -> int:
+        """ Requests waiting for a slot, in one family or across all of them """
+        if family is not None:
+            return self.gates[family].stats()["waiting"]  # type: ignore
+        return sum(gate.stats()["waiting"] for name, gate in self.gates.items() if name != GLOBAL_FAMILY)  # type: ignore
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {name: gate.stats() for name, gate in self.gates.items()}
+
+
+GOVERNOR = Governor()
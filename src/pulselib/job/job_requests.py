@@ -1,5 +1,4 @@
 import json
-import requests
 
 from ..errors import (
     JobNotFoundError,
@@ -8,6 +7,8 @@ from ..errors import (
 
 from .. import utils
 from ..config import CONFIG
+from ..client import CLIENT
+from .salesoffice import SalesOfficeTable
 
 
 def gen_query(wo_num: str) -> str:
@@ -15,38 +16,43 @@ def gen_query(wo_num: str) -> str:
         "job_no": wo_num
     })
 
-def query(query: dict) -> list[dict]:
-    url = f"{CONFIG.JOB_QUERY_URL}/?query={query}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    if not isinstance(body, list):
-        err = body.get("error")
-        if err:
-            raise JobUncaughtError(query, err)
-    return body
-        
+# URL building and response parsing, shared with aio.job_requests
+
+def _query_url(query: dict, columns: list[str] | None = None) -> str:
+    return f"{CONFIG.JOB_QUERY_URL}/?query={query}{utils.resultcolumns_param(columns)}"
+
+def _job_url(job_num: str) -> str:
+    return f"{CONFIG.JOB_URL}/job_no={str(job_num)}"
+
+def _parse_query(url: str, r: utils.AnyResponse, query: dict) -> list[dict]:
+    return utils.parse_list(url, r, lambda err: JobUncaughtError(query, err))
+
+def _parse_job(url: str, r: utils.AnyResponse, job_num: str) -> dict:
+    return utils.parse_record(url, r, lambda err: JobUncaughtError(job_num, err),
+                              lambda: JobNotFoundError(job_num))
+
+
+def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url)
+    return _parse_query(url, r, query)
 
 def get(job_num: str) -> dict:
-    url = f"{CONFIG.JOB_URL}/job_no={str(job_num)}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    err = body.get("error")
-    if err:
-        if err.startswith("Alternate key not found:"):
-            raise JobNotFoundError(job_num)
-        else:
-            raise JobUncaughtError(job_num, err)
-    return body
+    url = _job_url(job_num)
+    r = CLIENT.get(url)
+    return _parse_job(url, r, job_num)
 
-def get_project_manager_desc(sale_office_no: str) -> str:
+def get_sales_offices() -> list[dict]:
     url = f'{CONFIG.SALES_OFFICE_URL}'
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
+    r = CLIENT.get(url)
     body = json.loads(utils.verify_response(url=url, response=r))
     if not isinstance(body, list):
         err = body.get("error")
-        raise JobUncaughtError(sale_office_no, err)
-    for item in body:
-        if item["sale_office_no"] == sale_office_no:
-            pm_desc = item["sale_office_desc"]
-            return pm_desc
-    raise JobUncaughtError(sale_office_no, "No sales office description found matching: " + sale_office_no)
\ No newline at end of file
+        raise JobUncaughtError("JmSalesOffice", err)
+    return body
+
+def get_project_manager_desc(sale_office_no: str) -> str:
+    return SALES_OFFICES.desc(sale_office_no)
+
+
+SALES_OFFICES = SalesOfficeTable(get_sales_offices)
@@ -0,0 +1,60 @@
+import time
+import threading
+from typing import Callable
+
+from ..config import CONFIG
+from ..errors import JobUncaughtError
+
+
+class SalesOfficeTable:
+    """
+    JmSalesOffice rows indexed by sale_office_no.
+    The whole table is downloaded at most once per refresh interval,
+    with one extra reload when a lookup misses (e.g. a newly added office).
+    A number that is still missing after that reload is remembered as a miss
+    until the next scheduled refresh (or invalidate), so it doesn't reload again.
+    """
+    def __init__(self, fetch: Callable[[], list[dict]], refresh_interval: float | None = ...) -> None:
+        if refresh_interval is ...:
+            refresh_interval = CONFIG.SALES_OFFICE_REFRESH
+        self.fetch = fetch
+        self.refresh_interval = refresh_interval
+        self._index: dict[str, dict] = {}
+        self._misses: set[str] = set()
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    def _is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        if self.refresh_interval is None:
+            return False
+        return time.monotonic() - self._loaded_at > self.refresh_interval
+
+    def load(self, force: bool = False) -> None:
+        with self._lock:
+            if not force and not self._is_stale():
+                return
+            self._index = {item["sale_office_no"]: item for item in self.fetch()}
+            self._misses = set()
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def get(self, sale_office_no: str) -> dict:
+        self.load()
+        item = self._index.get(sale_office_no)
+        if item is None and sale_office_no not in self._misses:
+            self.load(force=True)
+            item = self._index.get(sale_office_no)
+            if item is None:
+                with self._lock:
+                    self._misses.add(sale_office_no)
+        if item is None:
+            raise JobUncaughtError(sale_office_no, "No sales office description found matching: " + sale_office_no)
+        return item
+
+    def desc(self, sale_office_no: str) -> str:
+        return self.get(sale_office_no)["sale_office_desc"]
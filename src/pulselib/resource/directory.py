@@ -0,0 +1,64 @@
+from typing import Iterable
+
+from ..cache import TTLCache
+from ..config import CONFIG
+
+from . import resource_requests
+from .model import Resource
+
+RESOURCE_DESC_KEY = "resource_desc"
+
+
+class ResourceDirectory:
+    """
+    In-memory lookup of SchResourceList entries keyed by resource_desc.
+    Names that were looked up but not found are remembered as well,
+    so repeated misses don't hit the server either.
+    columns: result column projection, None caches full records. A projected directory
+    holds partial jdicts, so it should only be shared by callers that read the projected fields.
+    """
+    CHUNK_SIZE = 50
+
+    def __init__(self, ttl: float | None = ..., columns: list[str] | None = None) -> None:
+        if ttl is ...:
+            ttl = CONFIG.RESOURCE_CACHE_TTL
+        self.columns = columns
+        self._cache: TTLCache[str, dict] = TTLCache(ttl)
+
+    def load(self, names: Iterable[str] | None = None, refresh: bool = False) -> None:
+        """ Bulk loads the given names, or every resource if names is None """
+        if names is None:
+            self._store(resource_requests.query({}, self.columns), [])
+            return
+        missing = sorted({name for name in names if refresh or name not in self._cache})
+        for i in range(0, len(missing), self.CHUNK_SIZE):
+            chunk = missing[i:i+self.CHUNK_SIZE]
+            results = resource_requests.query({RESOURCE_DESC_KEY: {"$in": chunk}}, self.columns)
+            self._store(results, chunk)
+
+    def get(self, name: str) -> Resource | None:
+        jdict = self._cache.get(name)
+        if jdict is None:
+            results = resource_requests.query({RESOURCE_DESC_KEY: name}, self.columns)
+            self._store(results, [name])
+            jdict = self._cache.get(name, {})
+        if not jdict:
+            return None
+        return Resource(jdict)
+
+    def invalidate(self, name: str | None = None) -> None:
+        self._cache.invalidate(name)
+
+    def _store(self, results: list[dict], requested: list[str]) -> None:
+        found: dict[str, dict] = {}
+        for jdict in results:
+            name = jdict.get(RESOURCE_DESC_KEY)
+            # first match wins, same as resource_requests.query(...)[0]
+            if name is not None and name not in found:
+                found[name] = jdict
+        notfound = [(name, {}) for name in requested if name not in found]
+        self._cache.update([*found.items(), *notfound])
+
+
+# Full records, shared process-wide
+RESOURCE_DIRECTORY = ResourceDirectory()
@@ -0,0 +1,75 @@
+from typing import Iterable
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import CONFIG
+
+from . import resource_requests
+from .model import Linguist
+from .qualifications import QualificationCatalogue, QUALIFICATIONS
+
+
+@dataclass
+class ImportResult:
+    row: int
+    name: str
+    code: str
+    posted: bool = False
+    grouped: bool = False
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+def _post_linguist(linguist: Linguist, result: ImportResult, group_code: str | None,
+                   isdefault: bool, catalogue: QualificationCatalogue) -> ImportResult:
+    try:
+        jdict = linguist.post_new(jdict_only=True, catalogue=catalogue)
+        resource_requests.post(jdict, retry=True)
+        result.posted = True
+        if group_code is not None:
+            resource_requests.post_resource_to_group(group_code, linguist.code, isdefault=isdefault)
+            result.grouped = True
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+def import_linguists(jdicts: Iterable[dict], group_code: str | None = None, isdefault: bool = True,
+                     max_workers: int | None = None,
+                     catalogue: QualificationCatalogue = QUALIFICATIONS) -> list[ImportResult]:
+    """
+    Posts a batch of linguist jdicts (the same shape Linguist() takes).
+    Every language is resolved against the qualification catalogue up front,
+    so missing qualifications are created once for the whole batch.
+    Returns one ImportResult per input row, in input order.
+    """
+    results: list[ImportResult] = []
+    pending: list[tuple[Linguist, ImportResult]] = []
+    for row, jdict in enumerate(jdicts):
+        try:
+            linguist = Linguist(jdict)
+        except Exception as e:
+            name = jdict.get("name") or ""
+            results.append(ImportResult(row, name, "", error=f"{type(e).__name__}: {e}"))
+            continue
+        result = ImportResult(row, linguist.name, linguist.code)
+        results.append(result)
+        pending.append((linguist, result))
+
+    languages = [lang for linguist, _ in pending for lang in linguist.languages]
+    try:
+        catalogue.ensure_many(languages)
+    except Exception as e:
+        for _, result in pending:
+            result.error = f"{type(e).__name__}: {e}"
+        return results
+
+    if not pending:
+        return results
+    workers = max_workers if max_workers is not None else CONFIG.MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+        for linguist, result in pending:
+            executor.submit(_post_linguist, linguist, result, group_code, isdefault, catalogue)
+    return results
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 from dataclasses import dataclass, field
 
 from . import resource_requests
+from .qualifications import QualificationCatalogue, QUALIFICATIONS
 from .resourcefiledmaps import RESOURCE_MAPS, LINGUIST_TEMPLATE
 
 if TYPE_CHECKING:
@@ -98,7 +99,7 @@ class Linguist(Resource):
         if is_email:
             self.email = is_email.group(0).strip()
 
-    def _add_qualifications(self) -> dict[str, list[dict]]:
+    def _add_qualifications(self, catalogue: QualificationCatalogue = QUALIFICATIONS) -> dict[str, list[dict]]:
         # {
         #     "sch_resource_qual": [
         #         {
@@ -114,14 +115,9 @@ class Linguist(Resource):
         qualifications = {}
         qualifications["sch_resource_qual"] = []
         dsp = 1
+        quals = catalogue.ensure_many(self.languages)
         for lang in self.languages:
-            qual = resource_requests.query_qualifications({"qualification_desc": lang})
-            if not qual:
-                resource_requests.post_qualification({"qualification_desc": lang})
-                qual = resource_requests.query_qualifications({"qualification_desc": lang})
-                if not qual:
-                    raise RuntimeError(f"Unable to add qualification: {lang}")
-            qual_no = qual[0]["qualification_no"]
+            qual_no = quals[lang]["qualification_no"]
             qualifications["sch_resource_qual"].append({
                 "dsp_seq": dsp,
                 "qualification_no": {
@@ -133,7 +129,7 @@ class Linguist(Resource):
             dsp += 1
         return qualifications
 
-    def post_new(self, jdict_only: bool = False) -> dict:
+    def post_new(self, jdict_only: bool = False, catalogue: QualificationCatalogue = QUALIFICATIONS) -> dict:
         jdict: dict[str, Any] = deepcopy(LINGUIST_TEMPLATE)
         for key in self.fieldmaps:
             value = getattr(self, key)
@@ -141,7 +137,7 @@ class Linguist(Resource):
                 value = ";".join(value)
             jdict.update(self.fieldmaps[key].makejdict(value))
         jdict["resource_code"]["resource_code"] = self.code
-        jdict.update(self._add_qualifications())
+        jdict.update(self._add_qualifications(catalogue))
         if not jdict_only:
             resource_requests.post(jdict)
         return jdict
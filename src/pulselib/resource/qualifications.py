@@ -0,0 +1,124 @@
+import threading
+from typing import Iterable
+
+from ..errors import ResourceUncaughtError
+
+from . import resource_requests
+
+QUALIFICATION_DESC_KEY = "qualification_desc"
+QUALIFICATION_NO_KEY = "qualification_no"
+
+
+class QualificationCatalogue:
+    """
+    In-memory index of SchQualification keyed by qualification_desc.
+    The endpoint can't be queried, so the full table is downloaded once,
+    reloaded before posting missing qualifications and then updated in place with the posted ones.
+    The lock only guards the index, downloads and posts run without it.
+    """
+    def __init__(self) -> None:
+        self._by_desc: dict[str, dict] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        # descs being posted right now, other threads wait on the event instead of posting them again
+        self._posting: dict[str, threading.Event] = {}
+        # descs posted by this catalogue, kept across reloads that started before the post landed
+        self._posted: set[str] = set()
+
+    def load(self, force: bool = False) -> None:
+        if self._loaded and not force:
+            return
+        quals = resource_requests.query_qualifications()
+        if not isinstance(quals, list):
+            err = quals.get("error") if isinstance(quals, dict) else None
+            raise ResourceUncaughtError("SchQualification", str(err or quals))
+        fresh: dict[str, dict] = {}
+        for qual in quals:
+            fresh.setdefault(qual.get(QUALIFICATION_DESC_KEY), qual)
+        with self._lock:
+            for desc in self._posted:
+                if desc not in fresh and desc in self._by_desc:
+                    fresh[desc] = self._by_desc[desc]
+            self._by_desc = fresh
+            self._loaded = True
+
+    def get(self, desc: str) -> dict | None:
+        self.load()
+        with self._lock:
+            return self._by_desc.get(desc)
+
+    def ensure(self, desc: str) -> dict:
+        return self.ensure_many([desc])[desc]
+
+    def ensure_many(self, descs: Iterable[str]) -> dict[str, dict]:
+        """ Returns qualifications for every desc, posting the missing ones first """
+        wanted = list(dict.fromkeys(descs))
+        self.load()
+        if self._missing(wanted):
+            # another process may have added some since the last load
+            self.load(force=True)
+        attempted: set[str] = set()
+        while True:
+            claimed, pending = self._claim(wanted, attempted)
+            if claimed:
+                attempted.update(claimed)
+                self._post(claimed)
+            if not pending:
+                break
+            # posted by another thread, a failed post is claimed and retried on the next pass
+            for event in pending:
+                event.wait()
+        with self._lock:
+            found = {}
+            for desc in wanted:
+                qual = self._by_desc.get(desc)
+                if qual is None:
+                    raise RuntimeError(f"Unable to add qualification: {desc}")
+                found[desc] = qual
+            return found
+
+    def _missing(self, wanted: list[str]) -> list[str]:
+        with self._lock:
+            return [desc for desc in wanted if desc not in self._by_desc]
+
+    def _claim(self, wanted: list[str], attempted: set[str]) -> tuple[list[str], list[threading.Event]]:
+        """ Reserves the missing descs nobody is posting, returns them and the events of the ones in flight """
+        claimed = []
+        pending = []
+        with self._lock:
+            for desc in wanted:
+                if desc in self._by_desc or desc in attempted:
+                    continue
+                event = self._posting.get(desc)
+                if event is not None:
+                    pending.append(event)
+                else:
+                    self._posting[desc] = threading.Event()
+                    claimed.append(desc)
+        return claimed, pending
+
+    def _post(self, claimed: list[str]) -> None:
+        try:
+            reload = False
+            for desc in claimed:
+                qual_no = resource_requests.post_qualification({QUALIFICATION_DESC_KEY: desc})
+                if qual_no is None:
+                    reload = True
+                    continue
+                with self._lock:
+                    self._by_desc[desc] = {QUALIFICATION_DESC_KEY: desc, QUALIFICATION_NO_KEY: qual_no}
+                    self._posted.add(desc)
+            if reload:
+                # the server didn't report some of the new keys
+                self.load(force=True)
+        finally:
+            with self._lock:
+                for desc in claimed:
+                    self._posting.pop(desc).set()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded = False
+
+
+QUALIFICATIONS = QualificationCatalogue()
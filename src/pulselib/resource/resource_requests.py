@@ -1,60 +1,136 @@
 import json
-import requests
+from typing import Iterator
 
-from ..errors import ResourceUncaughtError, ResourceNotFoundError, ResourceExistsError
+from ..errors import ResourceUncaughtError, ResourceNotFoundError, ResourceExistsError, RequestAppliedError
 
 from .. import utils
 from ..config import CONFIG
+from ..client import CLIENT
 
+# URL building, payloads and response parsing, shared with aio.resource_requests
 
-def query(query: dict) -> list[dict]:
-    url = f"{CONFIG.RESOURCE_QUERY_URL}/?query={query}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
+def _query_url(query: dict, columns: list[str] | None = None) -> str:
+    return f"{CONFIG.RESOURCE_QUERY_URL}/?query={query}{utils.resultcolumns_param(columns)}"
+
+def _resource_url(resource_code: str) -> str:
+    return f"{CONFIG.RESOURCE_URL}/resource_code={str(resource_code)}"
+
+def _qualification_url(qual_no: str) -> str:
+    return f"{CONFIG.QUALIFICATION_URL}/qualification_no={str(qual_no)}"
+
+def _resource_qual_url(res_code: str) -> str:
+    return f"{_resource_url(res_code)}/sch_resource_qual"
+
+def _group_resources_url(group_code: str, resource_code: str | None = None) -> str:
+    url = f"{CONFIG.SCHGROUP_URL}/group_code={str(group_code)}/sch_group_resource"
+    if resource_code is not None:
+        url += f"/resource_code={str(resource_code)}"
+    return url
+
+def _resource_qual_payload(res_code: str, qual_no: str) -> list[dict]:
+    return [{
+        "resource_code": res_code,
+        "qualification_no": qual_no
+    }]
+
+def _group_resource_payload(group_code: str, resource_code: str, isdefault: bool) -> list[dict]:
+    isdefault_str = "Y" if isdefault else "N"
+    return [{
+        "group_code": group_code,
+        "default_group": isdefault_str,
+        "resource_code": {
+            "resource_code": resource_code
+        }
+    }]
+
+def _parse_query(url: str, r: utils.AnyResponse, query: dict) -> list[dict]:
+    debugdict = query if query else {}
+    return utils.parse_list(url, r, lambda err: ResourceUncaughtError(debugdict, err))
+
+def _parse_record(url: str, r: utils.AnyResponse, key: str) -> dict:
+    return utils.parse_record(url, r, lambda err: ResourceUncaughtError(key, err),
+                              lambda: ResourceNotFoundError(key))
+
+def _parse_patch(url: str, r: utils.AnyResponse, resource_code: str) -> None:
+    utils.parse_write(url, r, lambda err: ResourceUncaughtError(resource_code, err),
+                      lambda: ResourceNotFoundError(resource_code))
+
+def _post_error(jdict: dict, err: str) -> Exception:
+    if "already exists" in err:
+        return ResourceExistsError(jdict, err)
+    return ResourceUncaughtError(jdict, err)
+
+def _parse_post(url: str, r: utils.AnyResponse, jdict: dict) -> None:
+    utils.parse_write(url, r, lambda err: _post_error(jdict, err))
+
+def _parse_write(url: str, r: utils.AnyResponse, debug: dict | str) -> None:
+    utils.parse_write(url, r, lambda err: ResourceUncaughtError(debug, err))
+
+def _parse_qualification_post(url: str, r: utils.AnyResponse, jdict: dict) -> int | str | None:
+    jbody = utils.parse_write(url, r, lambda err: ResourceUncaughtError(jdict, err))
+    qual_no = utils.created_key("qualification_no", jbody, r.headers.get("Location"))
+    # SchQualification keys are numeric, sch_resource_qual references them as ints
+    if qual_no is not None and qual_no.isdigit():
+        return int(qual_no)
+    return qual_no
+
+def _parse_qualifications(url: str, r: utils.AnyResponse, query: dict | None) -> list[dict]:
     body = json.loads(utils.verify_response(url=url, response=r))
     if not isinstance(body, list):
         err = body.get("error")
-        if err:
-            debugdict = query if query else {}
-            raise ResourceUncaughtError(debugdict, err)
-    return body
+        if err and query is not None:
+            raise ResourceUncaughtError(query, err)
+    return _filter_qualifications(body, query)
+
+def _parse_group_resources(url: str, r: utils.AnyResponse, group_code: str) -> list[dict]:
+    return utils.parse_list(url, r, lambda err: ResourceUncaughtError(f"{group_code}", err))
+
+
+def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+def iter_query(query: dict, columns: list[str] | None = None) -> Iterator[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url, stream=True)
+    debugdict = query if query else {}
+    yield from utils.iter_json_array(url, r, lambda err: ResourceUncaughtError(debugdict, err))
 
 def get(resource_code: str) -> dict:
-    url = f"{CONFIG.RESOURCE_URL}/resource_code={(str(resource_code))}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    err = body.get("error")
-    if err:
-        if err.startswith("Alternate key not found:"):
-            raise ResourceNotFoundError(resource_code)
-        else:
-            raise ResourceUncaughtError(resource_code, err)
-    return body
+    url = _resource_url(resource_code)
+    r = CLIENT.get(url)
+    return _parse_record(url, r, resource_code)
 
 def patch(resource_code: str, patchlist: list[dict]) -> None:
-    url = f"{CONFIG.RESOURCE_URL}/resource_code={str(resource_code)}"
-    r = requests.patch(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=patchlist)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            if err.startswith("Alternate key not found:"):
-                raise ResourceNotFoundError(resource_code)
-            else:
-                raise ResourceUncaughtError(resource_code, err)
-
-def post(jdict: dict) -> None:
+    url = _resource_url(resource_code)
+    r = CLIENT.patch(url, json=patchlist)
+    _parse_patch(url, r, resource_code)
+
+def _exists(resource_code: str) -> bool:
+    try:
+        get(resource_code)
+    except ResourceNotFoundError:
+        return False
+    return True
+
+def post(jdict: dict, retry: bool = False) -> bool:
+    """
+    retry: retries failed posts, checking with get() before each one
+    that the resource wasn't created by the failed attempt.
+    Returns False when it was: the resource exists but its POST response was never seen.
+    """
     url = f"{CONFIG.RESOURCE_URL}"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=jdict)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            if "already exists" in err:
-                raise ResourceExistsError(jdict, err)
-            else:
-                raise ResourceUncaughtError(jdict, err)
+    precheck = None
+    if retry:
+        resource_code = jdict["resource_code"]["resource_code"]
+        precheck = lambda: _exists(resource_code)
+    try:
+        r = CLIENT.post(url, json=jdict, retry=retry, precheck=precheck)
+    except RequestAppliedError:
+        return False
+    _parse_post(url, r, jdict)
+    return True
 
 
 def query_qualifications(query: dict | None = None) -> list[dict]:
@@ -64,12 +140,10 @@ def query_qualifications(query: dict | None = None) -> list[dict]:
     Filtering is done in the function itself.
     """
     url = f"{CONFIG.QUALIFICATION_URL}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    if not isinstance(body, list):
-        err = body.get("error")
-        if err and query is not None:
-            raise ResourceUncaughtError(query, err)
+    r = CLIENT.get(url)
+    return _parse_qualifications(url, r, query)
+
+def _filter_qualifications(body: list[dict], query: dict | None = None) -> list[dict]:
     if query is None:
         return body
     filtered = []
@@ -80,75 +154,32 @@ def query_qualifications(query: dict | None = None) -> list[dict]:
     return filtered
 
 def get_qualification(qual_no: str) -> dict:
-    url = f"{CONFIG.QUALIFICATION_URL}/qualification_no={str(qual_no)}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    err = body.get("error")
-    if err:
-        if err.startswith("Alternate key not found:"):
-            raise ResourceNotFoundError(qual_no)
-        else:
-            raise ResourceUncaughtError(qual_no, err)
-    return body
-
-def post_qualification(jdict: dict) -> None:
+    url = _qualification_url(qual_no)
+    r = CLIENT.get(url)
+    return _parse_record(url, r, qual_no)
+
+def post_qualification(jdict: dict) -> int | str | None:
+    """ Returns the new qualification_no if the server reports it """
     url = f"{CONFIG.QUALIFICATION_URL}"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=jdict)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise ResourceUncaughtError(jdict, err)
+    r = CLIENT.post(url, json=jdict)
+    return _parse_qualification_post(url, r, jdict)
 
 def add_qual_to_resource(res_code: str, qual_no: str) -> None:
-    jdict = [{
-        "resource_code": res_code,
-        "qualification_no": qual_no
-    }]
-    url = f"{CONFIG.RESOURCE_URL}/resource_code={res_code}/sch_resource_qual"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=jdict)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise ResourceUncaughtError(res_code, err)
+    url = _resource_qual_url(res_code)
+    r = CLIENT.post(url, json=_resource_qual_payload(res_code, qual_no))
+    _parse_write(url, r, res_code)
 
 def get_group_resources(group_code: str) -> list[dict]:
-    url = f"{CONFIG.SCHGROUP_URL}/group_code={group_code}/sch_group_resource"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    if not isinstance(body, list):
-        err = body.get("error")
-        if err:
-            raise ResourceUncaughtError(f"{group_code}", err)
-    return body
-        
+    url = _group_resources_url(group_code)
+    r = CLIENT.get(url)
+    return _parse_group_resources(url, r, group_code)
+
 def post_resource_to_group(group_code: str, resource_code: str, isdefault: bool = True) -> None:
-    isdefault_str = "Y" if isdefault else "N"
-    payload = [{
-        "group_code": group_code,
-        "default_group": isdefault_str,
-        "resource_code": {
-            "resource_code": resource_code
-        }
-    }]
-    url = f"{CONFIG.SCHGROUP_URL}/group_code={group_code}/sch_group_resource"
-    r = requests.post(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=payload)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise ResourceUncaughtError(f"{group_code}", err)
+    url = _group_resources_url(group_code)
+    r = CLIENT.post(url, json=_group_resource_payload(group_code, resource_code, isdefault))
+    _parse_write(url, r, f"{group_code}")
 
 def patch_groupresource(groupcode: str, resource_code: str, patchlist: list[dict]) -> None:
-    url = f"{CONFIG.SCHGROUP_URL}/group_code={str(groupcode)}/sch_group_resource/resource_code={str(resource_code)}"
-    r = requests.patch(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=patchlist)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            raise ResourceUncaughtError(f"{groupcode} - {resource_code}: ", err)
\ No newline at end of file
+    url = _group_resources_url(groupcode, resource_code)
+    r = CLIENT.patch(url, json=patchlist)
+    _parse_write(url, r, f"{groupcode} - {resource_code}: ")
@@ -1,4 +1,4 @@
-from ..fieldmaps import SimpleFieldMap, FieldTypeEnum
+from ..fieldmaps import SimpleFieldMap, FieldTypeEnum, result_columns
 
 LINGUIST_TEMPLATE = {
     "resource_type_no": 7,
@@ -15,4 +15,7 @@ RESOURCE_MAPS = {
     "location": SimpleFieldMap("location", FieldTypeEnum.STRING, "A_field_3"),
     "phone": SimpleFieldMap("phone", FieldTypeEnum.STRING, "A_field_7"),
     "type": SimpleFieldMap("type", FieldTypeEnum.DICT, ["resource_type_no", "resource_type_desc"])
-}
\ No newline at end of file
+}
+
+# list queries return resource_desc at the top level
+RESOURCE_SLIM_COLUMNS = result_columns(RESOURCE_MAPS, "resource_desc")
@@ -0,0 +1,39 @@
+import random
+from dataclasses import dataclass, field
+
+from .config import CONFIG
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PATCH"})
+GATEWAY_STATUSES = frozenset({502, 503, 504})
+# Opt-in, a 500 is often deterministic (bad payload) or raised after the write was applied
+SERVER_ERROR_STATUSES = GATEWAY_STATUSES | {500}
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff with jitter, shared by Client and AsyncClient.
+    retries is the number of attempts after the first one.
+    Connection errors and retry_statuses are retried for idempotent methods,
+    other methods only when the call opts in.
+    Pass retry_statuses=SERVER_ERROR_STATUSES to also retry 500s.
+    """
+    retries: int = field(default_factory=lambda: CONFIG.MP_RETRIES)
+    backoff: float = field(default_factory=lambda: CONFIG.MP_BACKOFF)
+    max_backoff: float = field(default_factory=lambda: CONFIG.MP_BACKOFF_MAX)
+    retry_statuses: frozenset[int] = GATEWAY_STATUSES
+
+    def should_retry(self, method: str, retry: bool | None = None) -> bool:
+        if self.retries < 1:
+            return False
+        if retry is not None:
+            return retry
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def delay(self, attempt: int) -> float:
+        """ Seconds to wait before retry number attempt (starting at 1) """
+        ceiling = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        return random.uniform(ceiling / 2, ceiling)
+
+
+NO_RETRY = RetryPolicy(retries=0)
@@ -1,32 +1,48 @@
-import json
-import requests
+from typing import Iterator
 
 from .. import utils
 from ..config import CONFIG
+from ..client import CLIENT
 from ..errors import RosterUncaughtError
 
 from .model import RosterTimeOff
 from .rosterfieldmaps import ROSTER_CODES
 
-def query(query: dict) -> list[dict]:
-    url = f"{CONFIG.ROSTER_QUERY_URL}/?query={query}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    if not isinstance(body, list):
-        err = body.get("error")
-        if err:
-            raise RosterUncaughtError(query, err)
-    return body
+# URL building and response parsing, shared with aio.roster_requests
 
-def by_date(daterange: tuple[str, str] | None = None, maintenance_only: bool=True) -> list[RosterTimeOff]:
+def _query_url(query: dict, columns: list[str] | None = None) -> str:
+    return f"{CONFIG.ROSTER_QUERY_URL}/?query={query}{utils.resultcolumns_param(columns)}"
+
+def _parse_query(url: str, r: utils.AnyResponse, query: dict) -> list[dict]:
+    return utils.parse_list(url, r, lambda err: RosterUncaughtError(query, err))
+
+
+def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url)
+    return _parse_query(url, r, query)
+
+def iter_query(query: dict, columns: list[str] | None = None) -> Iterator[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url, stream=True)
+    yield from utils.iter_json_array(url, r, lambda err: RosterUncaughtError(query, err))
+
+def _gen_by_date_query(daterange: tuple[str, str] | None = None, maintenance_only: bool=True) -> dict:
     query_params = {}
     if daterange is None:
         daterange = (utils.today(), utils.today())
     query_params["trx_begin_dt"] = {"$range": list(daterange)}
     if maintenance_only:
         query_params["time_off_type_no"] = "6"
-    jdict_list = query(query_params)
+    return query_params
+
+def by_date(daterange: tuple[str, str] | None = None, maintenance_only: bool=True) -> list[RosterTimeOff]:
+    jdict_list = query(_gen_by_date_query(daterange, maintenance_only))
     if jdict_list:
         return [RosterTimeOff(jdict) for jdict in jdict_list]
     else:
-        return []
\ No newline at end of file
+        return []
+
+def iter_by_date(daterange: tuple[str, str] | None = None, maintenance_only: bool=True) -> Iterator[RosterTimeOff]:
+    for jdict in iter_query(_gen_by_date_query(daterange, maintenance_only)):
+        yield RosterTimeOff(jdict)
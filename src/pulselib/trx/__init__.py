@@ -1,10 +1,13 @@
-from typing import Union
+from typing import Union, TYPE_CHECKING
 from dataclasses import dataclass
 
 from ..errors import TRXUncaughtError
 from ..resource.model import Resource
 from ..resource import resource_requests
 
+if TYPE_CHECKING:
+    from ..resource.directory import ResourceDirectory
+
 
 @dataclass()
 class Transaction:
@@ -68,7 +71,9 @@ class Transaction:
             raise TRXUncaughtError(d) from e
         return obj
     
-    def get_resource(self) -> Union["Resource", None]:
+    def get_resource(self, directory: Union["ResourceDirectory", None] = None) -> Union["Resource", None]:
+        if directory is not None:
+            return directory.get(self.name)
         results = resource_requests.query({"resource_desc": self.name})
         if results:
             return Resource(results[0])
@@ -78,6 +83,10 @@ class Transaction:
     def __str__(self) -> str:
         return f"{self.name} - Job:{self.job} - WO:{self.wo} - ({self.begin} - {self.end})"
 
+    @property
+    def identity(self) -> tuple[str, str, str, str, str]:
+        return (self.name, self.job, self.wo, self.begin, self.end)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Transaction):
             return False
@@ -1,13 +1,48 @@
 import json
-import requests
-from typing import overload, Literal
+from datetime import date, timedelta
+from typing import overload, Literal, Iterator
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 from ..config import CONFIG
+from ..client import CLIENT
 from .. import utils, PhaseEnum
 
 from . import Transaction
 
-def _gen_query(daterange: tuple[str, str] | None = None) -> str:
+TRX_RESULT_COLUMNS = [
+    "wo_no_seq",
+    "resource_desc",
+    "trx_begin_dt",
+    "trx_end_dt",
+    "row_display",
+    "customer_name",
+    "note_no_text",
+    "group_desc",
+    "job_desc",
+    "wo_job_no",
+    "wo_desc",
+    "WO_field_2",
+    "wo_type_no",
+    "wo_begin_dt",
+    "job_table1_no",
+    "phase_code",
+    "user_added"
+]
+
+def _excluded_phases(onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True) -> list[str]:
+    excluded = []
+    if not onhold:
+        excluded.append(PhaseEnum.hold.code)
+    if not invoiced:
+        excluded.append(PhaseEnum.invoiced.code)
+    if not proposed:
+        excluded.append(PhaseEnum.proposed.code)
+    if not inprogress:
+        excluded.append(PhaseEnum.in_progress.code)
+    return excluded
+
+def _gen_query(daterange: tuple[str, str] | None = None, excluded_phases: list[str] | None = None) -> str:
     if daterange is None:
         daterange = (utils.today(), utils.today())
     queryparams = {
@@ -24,45 +59,47 @@ def _gen_query(daterange: tuple[str, str] | None = None) -> str:
             "$ne": "VOID"
         }
     }
+    if excluded_phases:
+        queryparams["phase_code"] = {"$nin": ["VOID", *excluded_phases]}
     return json.dumps(queryparams, indent=0)
 
-def _gen_resultcolumns() -> str:
+def _gen_resultcolumns(columns: list[str] | None = None) -> str:
+    if columns is None:
+        columns = TRX_RESULT_COLUMNS
     return json.dumps({
-        "L": [
-            "wo_no_seq",
-            "resource_desc",
-            "trx_begin_dt",
-            "trx_end_dt",
-            "row_display",
-            "customer_name",
-            "note_no_text",
-            "group_desc",
-            "job_desc",
-            "wo_job_no",
-            "wo_desc",
-            "WO_field_2",
-            "wo_type_no",
-            "wo_begin_dt",
-            "job_table1_no",
-            "phase_code",
-            "user_added"
-        ]
+        "L": columns
     })
 
 def _gen_listquery_url(query: str, resultcolumns: str) -> str:
+    # indent=0 queries span lines, requests quotes the newlines itself but httpx rejects them
+    query = query.replace("\n", "%0A")
     return f"{CONFIG.TRX_QUERY_URL}/?query={query}&resultColumns={resultcolumns}"
 
-def _list_query(query: str, resultcolumns: str) -> list[dict]:
-    fullurl = _gen_listquery_url(query, resultcolumns)
-    res = requests.get(url=fullurl, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
+def _parse_list_query(fullurl: str, res: utils.AnyResponse) -> list[dict]:
+    """ Shared with aio.trx_requests """
     body = utils.verify_response(url=fullurl, response=res)
     return json.loads(body)
 
-def query(querydict: dict) -> list[dict]:
+def _list_query(query: str, resultcolumns: str) -> list[dict]:
+    fullurl = _gen_listquery_url(query, resultcolumns)
+    res = CLIENT.get(fullurl)
+    return _parse_list_query(fullurl, res)
+
+def _iter_list_query(query: str, resultcolumns: str) -> Iterator[dict]:
+    fullurl = _gen_listquery_url(query, resultcolumns)
+    res = CLIENT.get(fullurl, stream=True)
+    yield from utils.iter_json_array(fullurl, res, lambda err: LookupError(f"trx_requests: {err} - {query}"))
+
+def query(querydict: dict, columns: list[str] | None = None) -> list[dict]:
     query = json.dumps(querydict, indent=0)
-    resultcolumns = _gen_resultcolumns()
+    resultcolumns = _gen_resultcolumns(columns)
     return _list_query(query, resultcolumns)
 
+def iter_query(querydict: dict, columns: list[str] | None = None) -> Iterator[dict]:
+    query = json.dumps(querydict, indent=0)
+    resultcolumns = _gen_resultcolumns(columns)
+    return _iter_list_query(query, resultcolumns)
+
 @overload
 def by_date(daterange: tuple[str, str] | None = None,
             onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
@@ -74,13 +111,22 @@ def by_date(daterange: tuple[str, str] | None = None,
 def by_date(daterange: tuple[str, str] | None = None,
             onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
             raw: bool=False):
-    query = _gen_query(daterange)
+    query = _gen_query(daterange, _excluded_phases(onhold, invoiced, proposed, inprogress))
     resultcolumns = _gen_resultcolumns()
     response = _list_query(query, resultcolumns)
+    return _by_date_results(response, onhold, invoiced, proposed, inprogress, raw)
+
+def _by_date_results(response: list[dict],
+                     onhold: bool, invoiced: bool, proposed: bool, inprogress: bool,
+                     raw: bool) -> list[dict] | list[Transaction]:
     if raw:
         return response
     trx = [Transaction.from_dict(d) for d in response]
-    if onhold and invoiced:
+    return _filter_phases(trx, onhold, invoiced, proposed, inprogress)
+
+def _filter_phases(trx: list[Transaction],
+                   onhold: bool, invoiced: bool, proposed: bool, inprogress: bool) -> list[Transaction]:
+    if onhold and invoiced and proposed and inprogress:
         return trx
     
     filteredtrx = []
@@ -94,4 +140,64 @@ def by_date(daterange: tuple[str, str] | None = None,
         if not inprogress and t.phase_code == PhaseEnum.in_progress.code:
             continue
         filteredtrx.append(t)        
-    return filteredtrx
\ No newline at end of file
+    return filteredtrx
+
+def split_daterange(daterange: tuple[str, str] | None = None, window_days: int=1) -> list[tuple[str, str]]:
+    """ Splits an inclusive YYYY-MM-DD range into consecutive, non-overlapping windows """
+    if window_days < 1:
+        raise ValueError(f"window_days must be at least 1: {window_days}")
+    if daterange is None:
+        daterange = (utils.today(), utils.today())
+    start = date.fromisoformat(daterange[0])
+    end = date.fromisoformat(daterange[1])
+    windows = []
+    while start <= end:
+        stop = min(start + timedelta(days=window_days - 1), end)
+        windows.append((start.isoformat(), stop.isoformat()))
+        start = stop + timedelta(days=1)
+    return windows
+
+def _window_query(daterange: tuple[str, str], excluded_phases: list[str] | None = None) -> list[dict]:
+    return _list_query(_gen_query(daterange, excluded_phases), _gen_resultcolumns())
+
+@overload
+def iter_by_date(daterange: tuple[str, str] | None = None, window_days: int=1, max_workers: int | None = None,
+                 onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                 raw: Literal[True]=True) -> Iterator[dict]:...
+@overload
+def iter_by_date(daterange: tuple[str, str] | None = None, window_days: int=1, max_workers: int | None = None,
+                 onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                 raw: Literal[False]=False) -> Iterator[Transaction]:...
+def iter_by_date(daterange: tuple[str, str] | None = None, window_days: int=1, max_workers: int | None = None,
+                 onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                 raw: bool=False):
+    """
+    Same results as by_date, but the range is fetched as concurrent windows of window_days.
+    Windows are yielded in date order as soon as each one (and those before it) has arrived.
+    """
+    windows = split_daterange(daterange, window_days)
+    if not windows:
+        return
+    workers = max_workers if max_workers is not None else CONFIG.MAX_WORKERS
+    excluded = _excluded_phases(onhold, invoiced, proposed, inprogress)
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(windows)))
+    try:
+        for response in executor.map(partial(_window_query, excluded_phases=excluded), windows):
+            yield from _by_date_results(response, onhold, invoiced, proposed, inprogress, raw)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+@overload
+def by_date_chunked(daterange: tuple[str, str] | None = None, window_days: int=1, max_workers: int | None = None,
+                    onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                    raw: Literal[True]=True) -> list[dict]:...
+@overload
+def by_date_chunked(daterange: tuple[str, str] | None = None, window_days: int=1, max_workers: int | None = None,
+                    onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                    raw: Literal[False]=False) -> list[Transaction]:...
+def by_date_chunked(daterange: tuple[str, str] | None = None, window_days: int=1, max_workers: int | None = None,
+                    onhold: bool=True, invoiced: bool=True, proposed: bool=True, inprogress: bool=True,
+                    raw: bool=False):
+    return list(iter_by_date(daterange, window_days, max_workers,
+                             onhold=onhold, invoiced=invoiced, proposed=proposed, inprogress=inprogress,
+                             raw=raw))
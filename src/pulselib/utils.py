@@ -1,10 +1,15 @@
+import re
 import json
+import codecs
 from datetime import datetime
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, Iterator, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .trx import Transaction
     from requests import Response
+    from httpx import Response as AsyncResponse
+
+AnyResponse = Union["Response", "AsyncResponse"]
 
 def print_json(jdict_or_list: Any) -> None:
     jstr = json.dumps(jdict_or_list, indent=4, sort_keys=True)
@@ -15,16 +20,172 @@ def print_transactions(trxlist: list["Transaction"]) -> None:
     jstr = json.dumps(combined, indent=4, sort_keys=True)
     print(jstr)
 
-def verify_response(url: str, response: "Response") -> str:
+def _no_body_error(url: str, status_code: int) -> LookupError:
+    msg1 = "HTTP Response did not contain a body."
+    msg2 = f"URL: {url}"
+    msg3 = f"Status Code: {status_code}"
+    full_msg = "\n".join([msg1, msg2, msg3])
+    return LookupError(full_msg)
+
+def verify_response(url: str, response: AnyResponse) -> str:
     if response.status_code == 204 or response.status_code == 201:
         return ""
     if not response.text:
-        msg1 = "HTTP Response did not contain a body."
-        msg2 = f"URL: {url}"
-        msg3 = f"Status Code: {response.status_code}"
-        full_msg = "\n".join([msg1, msg2, msg3])
-        raise LookupError(full_msg)
-    return response.text.encode('utf-8').decode('utf-8')
+        raise _no_body_error(url, response.status_code)
+    return response.text
+
+NOT_FOUND_PREFIX = "Alternate key not found:"
+
+def _raise_body_error(jbody: Any, onerror: Callable[[str], Exception],
+                      onnotfound: Callable[[], Exception] | None) -> None:
+    err = jbody.get("error") if isinstance(jbody, dict) else None
+    if err:
+        if onnotfound is not None and err.startswith(NOT_FOUND_PREFIX):
+            raise onnotfound()
+        raise onerror(err)
+
+def parse_list(url: str, response: AnyResponse,
+               onerror: Callable[[str], Exception]) -> list:
+    """ Decodes a list query/get response, a Mediapulse error object is raised via onerror """
+    body = json.loads(verify_response(url=url, response=response))
+    _raise_body_error(body, onerror, None)
+    return body
+
+def parse_record(url: str, response: AnyResponse,
+                 onerror: Callable[[str], Exception],
+                 onnotfound: Callable[[], Exception] | None = None) -> dict:
+    """ Decodes a single record response, "Alternate key not found" is raised via onnotfound when given """
+    body = json.loads(verify_response(url=url, response=response))
+    _raise_body_error(body, onerror, onnotfound)
+    return body
+
+def parse_write(url: str, response: AnyResponse,
+                onerror: Callable[[str], Exception],
+                onnotfound: Callable[[], Exception] | None = None) -> Any:
+    """ Checks a POST/PATCH response, returns the decoded body or None if there was none """
+    body = verify_response(url=url, response=response)
+    if not body:
+        return None
+    jbody = json.loads(body)
+    _raise_body_error(jbody, onerror, onnotfound)
+    return jbody
+
+# Longest text a decode error can point at that may still be a valid token cut off by the
+# end of the buffer (-Infinity, a \uXXXX escape), errors further back are final.
+_MAX_PARTIAL_TOKEN = 16
+
+def iter_json_array(url: str, response: "Response", onerror: Callable[[str], Exception],
+                    chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Decodes a JSON array body element by element straight from a streamed response
+    (requested with stream=True), so the full payload is never held in memory.
+    A JSON object body (Mediapulse errors) is decoded whole; its "error" is raised via onerror.
+    """
+    try:
+        if response.status_code == 204 or response.status_code == 201:
+            return
+        chunks = response.iter_content(chunk_size=chunk_size)
+        textdecoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def read_more() -> bool:
+            nonlocal buffer, pos, eof
+            if eof:
+                return False
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+                buffer = buffer[pos:] + textdecoder.decode(b"", final=True)
+            else:
+                buffer = buffer[pos:] + textdecoder.decode(chunk)
+            pos = 0
+            return True
+
+        def next_token() -> str:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not read_more():
+                    return ""
+
+        first = next_token()
+        if not first:
+            raise _no_body_error(url, response.status_code)
+        if first != "[":
+            while read_more():
+                pass
+            body = json.loads(buffer[pos:])
+            if isinstance(body, dict) and body.get("error"):
+                raise onerror(body["error"])
+            yield body
+            return
+
+        pos += 1
+        if next_token() == "]":
+            return
+        while True:
+            next_token()
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                # only an error at the end of the buffer can be fixed by reading more,
+                # re-parsing a malformed element on every chunk would be quadratic
+                if not e.msg.startswith("Unterminated string") and len(buffer) - e.pos > _MAX_PARTIAL_TOKEN:
+                    raise
+                item, end = None, -1
+            # a number split across chunks parses early (15000 of 15000.0, 1 of 1e5),
+            # so an element only counts once it's followed by a delimiter or the body ends
+            complete = end != -1 and (
+                (end == len(buffer) and eof) or
+                (end < len(buffer) and (buffer[end] in ",]" or buffer[end].isspace()))
+            )
+            if not complete and not eof:
+                if not read_more():
+                    raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+                continue
+            if end == -1:
+                raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+            pos = end
+            yield item
+            separator = next_token()
+            if separator == "]":
+                return
+            if not separator:
+                raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+            if separator != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+    finally:
+        response.close()
+
+def resultcolumns_param(columns: list[str] | None = None) -> str:
+    """ Formats a list query column projection, empty string returns full records """
+    if not columns:
+        return ""
+    return f"&resultColumns={json.dumps({'L': columns})}"
+
+def created_key(key: str, jbody: Any, location: str | None = None) -> str | None:
+    """
+    Pulls the alternate key of a newly created record from a POST response,
+    either from the body ({key: value} or {key: {key: value}}) or from a Location header ending in key=value.
+    """
+    if isinstance(jbody, dict):
+        value = jbody.get(key)
+        if isinstance(value, dict):
+            value = value.get(key)
+        if value:
+            return str(value)
+    if location:
+        match = re.search(rf"{re.escape(key)}=([^/&?]+)", location)
+        if match:
+            return match.group(1)
+    return None
 
 def today() -> str:
     return datetime.now().strftime('%Y-%m-%d')
\ No newline at end of file
@@ -1,8 +1,11 @@
 from typing import Any
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
+from ..config import CONFIG
 from ..errors import AssetExistsError
-from ..asset import Asset, asset_requests
+from ..asset import Asset, SpecInterface, get_assets_by_no, get_assets_by_path
+from ..asset.assetfieldmaps import ASSET_PATH_COLUMNS
 
 from . import wo_requests
 from .sources import WOSource
@@ -31,17 +34,15 @@ class WorkOrder:
     def find_key(self, key: str) -> Any:
         return self.fieldmaps[key].read(self.jdict)
     
-    def pull_assets(self, refresh: bool=False) -> None:
+    def pull_assets(self, refresh: bool=False, max_workers: int | None = None) -> None:
+        """ Assets come from the shared ASSET_CACHE, refresh=True refetches them """
         if refresh:
             self._assetspulled = False
         elif self._assetspulled:
             return
-        assets = []
-        for source in self.sources:
-            if source.asset_no:
-                jdict = asset_requests.get(source.asset_no)
-                assets.append(Asset(jdict))
-        self.assets = assets
+        assetnos = [source.asset_no for source in self.sources if source.asset_no]
+        jdicts = get_assets_by_no(assetnos, refresh=refresh, max_workers=max_workers)
+        self.assets = [Asset(jdicts[assetno]) for assetno in assetnos]
         self._assetspulled = True
 
     def sources_ready(self) -> list[WOSource]:
@@ -51,29 +52,57 @@ class WorkOrder:
                 ready_to_create.append(source)
         return ready_to_create
 
-    def make_asset(self, seq_no: int, use_existing: bool=True, force: bool=False) -> str:
+    def make_asset(self, seq_no: int, use_existing: bool=True, force: bool=False, existing: dict=...) -> str:
         for source in self.sources:
             if source.seq_no != seq_no:
                 continue
-            asset = source.new_asset(force=force)
-            try:
-                asset.post_new()
-            except AssetExistsError as e:
-                if not use_existing:
-                    raise e
-            asset.refresh()
-            asset.wo_seq = source.seq_no
+            asset = self._source_to_asset(source, use_existing, force, existing)
             self.assets.append(asset)
-            if not asset.assetno:
-                msg = f"Workorder.make_asset: Asset did not receive assetno, source: {seq_no}"
-                raise RuntimeError(msg)
-            return asset.assetno
+            return asset.assetno # type: ignore
         raise ValueError(f"Workorder.make_asset: Unable to find source: {seq_no}")
 
-    def sources_to_assets(self) -> None:
+    def sources_to_assets(self, parallel: bool=False, max_workers: int | None = None) -> UpdateResults:
+        """
+        Creates an asset for every source in sources_ready.
+        Existing assets are looked up in bulk first, one query per directory.
+        Serial mode raises the first failure, as before, and now also returns UpdateResults
+        (it used to return None). In parallel mode sources are probed and posted on a thread pool
+        and failures are collected per source instead of raised, a failed lookup only fails
+        the sources in the directory it covered.
+        """
         ready = self.sources_ready()
-        for source in ready:
-            self.make_asset(source.seq_no)
+        if not ready:
+            return UpdateResults([], [])
+        paths = [SpecInterface(source.fullpath).path for source in ready]
+        lookup_errors: dict[str, Exception] = {}
+        existing = get_assets_by_path(paths, columns=ASSET_PATH_COLUMNS, errors=lookup_errors)
+        if not parallel:
+            for source, path in zip(ready, paths):
+                if path in lookup_errors:
+                    raise lookup_errors[path]
+                self.make_asset(source.seq_no, existing=existing[path])
+            return UpdateResults(paths, [])
+
+        updated = []
+        errors = []
+        workers = max_workers if max_workers is not None else CONFIG.MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=min(workers, len(ready))) as executor:
+            futures = [
+                None if path in lookup_errors else
+                executor.submit(self._source_to_asset, source, True, False, existing[path])
+                for source, path in zip(ready, paths)
+            ]
+            for source, path, future in zip(ready, paths, futures):
+                try:
+                    if future is None:
+                        raise lookup_errors[path]
+                    asset = future.result()
+                except Exception as e:
+                    errors.append(f"{type(e).__name__}: Source {source.seq_no} - {e}")
+                else:
+                    self.assets.append(asset)
+                    updated.append(path)
+        return UpdateResults(updated, errors)
 
     def update_sources(self) -> UpdateResults:
         updated = []
@@ -97,6 +126,20 @@ class WorkOrder:
                     break
         return UpdateResults(updated, errors)
     
+    def _source_to_asset(self, source: WOSource, use_existing: bool, force: bool, existing: dict=...) -> Asset:
+        asset = source.new_asset(force=force)
+        try:
+            asset.post_new(existing=existing)
+        except AssetExistsError as e:
+            if not use_existing:
+                raise e
+        asset.refresh()
+        asset.wo_seq = source.seq_no
+        if not asset.assetno:
+            msg = f"Workorder.make_asset: Asset did not receive assetno, source: {source.seq_no}"
+            raise RuntimeError(msg)
+        return asset
+
     def _get_sources(self) -> list[WOSource]:
         asset_dicts: list[dict] | None = self.jdict.get("mo_source")
         if not asset_dicts:
@@ -1,5 +1,4 @@
 import json
-import requests
 
 from ..errors import (
     WorkOrderNotFoundError,
@@ -8,6 +7,7 @@ from ..errors import (
 
 from .. import utils
 from ..config import CONFIG
+from ..client import CLIENT
 
 
 def gen_query(wo_num: str) -> str:
@@ -15,51 +15,45 @@ def gen_query(wo_num: str) -> str:
         "wo_no_seq": wo_num
     })
 
-def query(query: dict) -> list[dict]:
-    url = f"{CONFIG.WO_QUERY_URL}/?query={query}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    if not isinstance(body, list):
-        err = body.get("error")
-        if err:
-            raise WorkOrderUncaughtError(query, err)
-    return body
-        
+# URL building and response parsing, shared with aio.wo_requests
+
+def _query_url(query: dict, columns: list[str] | None = None) -> str:
+    return f"{CONFIG.WO_QUERY_URL}/?query={query}{utils.resultcolumns_param(columns)}"
+
+def _wo_url(wo_no: str) -> str:
+    return f"{CONFIG.WO_URL}/wo_no_seq={str(wo_no)}"
+
+def _source_url(wo_no: str, seq_no: int) -> str:
+    return f"{_wo_url(wo_no)}/mo_source/dsp_seq={str(seq_no)}"
+
+def _parse_query(url: str, r: utils.AnyResponse, query: dict) -> list[dict]:
+    return utils.parse_list(url, r, lambda err: WorkOrderUncaughtError(query, err))
+
+def _parse_wo(url: str, r: utils.AnyResponse, wo_no: str) -> dict:
+    return utils.parse_record(url, r, lambda err: WorkOrderUncaughtError(wo_no, err),
+                              lambda: WorkOrderNotFoundError(wo_no))
+
+def _parse_patch(url: str, r: utils.AnyResponse, wo_no: str) -> None:
+    utils.parse_write(url, r, lambda err: WorkOrderUncaughtError(wo_no, err),
+                      lambda: WorkOrderNotFoundError(wo_no))
+
+
+def query(query: dict, columns: list[str] | None = None) -> list[dict]:
+    url = _query_url(query, columns)
+    r = CLIENT.get(url)
+    return _parse_query(url, r, query)
 
 def get(wo_num: str) -> dict:
-    url = f"{CONFIG.WO_URL}/wo_no_seq={str(wo_num)}"
-    r = requests.get(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD))
-    body = json.loads(utils.verify_response(url=url, response=r))
-    err = body.get("error")
-    if err:
-        if err.startswith("Alternate key not found:"):
-            raise WorkOrderNotFoundError(wo_num)
-        else:
-            raise WorkOrderUncaughtError(wo_num, err)
-    return body
+    url = _wo_url(wo_num)
+    r = CLIENT.get(url)
+    return _parse_wo(url, r, wo_num)
 
 def patch(wo_no: str, patchlist: list[dict]) -> None:
-    url = f"{CONFIG.WO_URL}/wo_no_seq={str(wo_no)}"
-    r = requests.patch(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=patchlist)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            if err.startswith("Alternate key not found:"):
-                raise WorkOrderNotFoundError(wo_no)
-            else:
-                raise WorkOrderUncaughtError(wo_no, err)
+    url = _wo_url(wo_no)
+    r = CLIENT.patch(url, json=patchlist)
+    _parse_patch(url, r, wo_no)
 
 def patch_source(wo_no: str, seq_no: int, patchlist: list[dict]) -> None:
-    url = f"{CONFIG.WO_URL}/wo_no_seq={str(wo_no)}/mo_source/dsp_seq={str(seq_no)}"
-    r = requests.patch(url=url, auth=(CONFIG.USERNAME, CONFIG.PASSWORD), json=patchlist)
-    body = utils.verify_response(url=url, response=r)
-    if body:
-        jbody = json.loads(body)
-        err = jbody.get("error")
-        if err:
-            if err.startswith("Alternate key not found:"):
-                raise WorkOrderNotFoundError(wo_no)
-            else:
-                raise WorkOrderUncaughtError(wo_no, err)
\ No newline at end of file
+    url = _source_url(wo_no, seq_no)
+    r = CLIENT.patch(url, json=patchlist)
+    _parse_patch(url, r, wo_no)
@@ -0,0 +1,5 @@
+import os
+
+# pulselib.config refuses to load without credentials, nothing in the suite talks to Mediapulse
+os.environ.setdefault("MP_USERNAME", "test")
+os.environ.setdefault("MP_PASSWORD", "test")
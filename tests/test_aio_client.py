@@ -0,0 +1,78 @@
+import asyncio
+
+import httpx
+import pytest
+
+# pulselib.aio shares the asset request helpers, which need the git dependencies
+pytest.importorskip("mediaprobe")
+pytest.importorskip("rosettapath")
+pytest.importorskip("tclib3")
+
+from pulselib.aio.client import AsyncClient
+from pulselib.errors import RequestAppliedError
+from pulselib.governor import Governor, Limit
+from pulselib.retry import RetryPolicy
+
+URL = "http://mediapulse.test/api/JmJob"
+
+
+def make_async_client(*statuses, **policy) -> tuple[AsyncClient, list[str]]:
+    calls: list[str] = []
+    remaining = list(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(remaining.pop(0))
+
+    policy.setdefault("retries", 2)
+    client = AsyncClient(auth=("u", "p"), retry_policy=RetryPolicy(backoff=0, max_backoff=0, **policy),
+                         governor=Governor({}))
+    client._bind = lambda: (httpx.AsyncClient(transport=httpx.MockTransport(handler)),  # type: ignore
+                            asyncio.Semaphore(4))
+    return client, calls
+
+
+def test_async_gateway_error_is_retried_and_500_is_not():
+    client, calls = make_async_client(502, 200)
+    assert asyncio.run(client.get(URL)).status_code == 200
+    assert calls == ["GET", "GET"]
+    client, calls = make_async_client(500, 200)
+    assert asyncio.run(client.get(URL)).status_code == 500
+    assert calls == ["GET"]
+
+
+def test_async_post_and_precheck():
+    client, calls = make_async_client(502, 200)
+    assert asyncio.run(client.post(URL, json={})).status_code == 502
+
+    async def applied() -> bool:
+        return True
+
+    client, calls = make_async_client(502, 200)
+    with pytest.raises(RequestAppliedError):
+        asyncio.run(client.post(URL, json={}, retry=True, precheck=applied))
+    assert calls == ["POST"]
+
+
+def test_async_body_is_read_inside_the_governor_slot():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=1)})
+    seen: list[int] = []
+
+    async def body():
+        seen.append(governor.gates["DEFAULT"].in_flight)
+        await asyncio.sleep(0.01)
+        yield b"[]"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    client = AsyncClient(auth=("u", "p"), retry_policy=RetryPolicy(retries=0), governor=governor)
+    client._bind = lambda: (httpx.AsyncClient(transport=httpx.MockTransport(handler)),  # type: ignore
+                            asyncio.Semaphore(4))
+
+    async def main() -> None:
+        await asyncio.gather(*(client.get(URL) for _ in range(4)))
+
+    asyncio.run(main())
+    assert seen == [1, 1, 1, 1]
+    assert governor.gates["DEFAULT"].in_flight == 0
@@ -0,0 +1,84 @@
+import json
+import asyncio
+
+import pytest
+
+pytest.importorskip("mediaprobe")
+pytest.importorskip("rosettapath")
+pytest.importorskip("tclib3")
+
+from pulselib.errors import AssetUncaughtError
+from pulselib.asset import asset_requests, lookup, ASSET_CACHE
+from pulselib.aio import asset_requests as aio_asset_requests
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: object = None) -> None:
+        self.status_code = status_code
+        self.text = "" if body is None else json.dumps(body)
+        self.headers: dict = {}
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.record = {"master_no": 123, "title": "before"}
+        self.patch_response = FakeResponse(204)
+        self.gets = 0
+
+    def get(self, url: str, **kwargs) -> FakeResponse:
+        self.gets += 1
+        return FakeResponse(200, self.record)
+
+    def patch(self, url: str, **kwargs) -> FakeResponse:
+        return self.patch_response
+
+    post = patch
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(asset_requests, "CLIENT", fake)
+    ASSET_CACHE.invalidate()
+    yield fake
+    ASSET_CACHE.invalidate()
+
+
+def test_patch_evicts_int_assetno(client):
+    assert lookup.get_asset_by_no(123)["title"] == "before"
+    client.record = {"master_no": 123, "title": "after"}
+    asset_requests.patch(123, [])
+    assert lookup.get_asset_by_no(123)["title"] == "after"
+    assert client.gets == 2
+
+
+def test_audio_writes_evict(client):
+    lookup.get_asset_by_no("123")
+    asset_requests.post_audio(123, [])
+    assert 123 not in ASSET_CACHE
+    lookup.get_asset_by_no(123)
+    asset_requests.patch_audio("123", "1", [])
+    assert "123" not in ASSET_CACHE
+
+
+def test_failed_patch_keeps_cache(client):
+    lookup.get_asset_by_no(123)
+    client.patch_response = FakeResponse(200, {"error": "locked"})
+    with pytest.raises(AssetUncaughtError):
+        asset_requests.patch(123, [])
+    assert "123" in ASSET_CACHE
+
+
+def test_aio_writes_evict(client, monkeypatch):
+    class FakeAsyncClient:
+        async def patch(self, url: str, **kwargs) -> FakeResponse:
+            return FakeResponse(204)
+        post = patch
+
+    monkeypatch.setattr(aio_asset_requests, "AIO_CLIENT", FakeAsyncClient())
+    for write in (lambda: aio_asset_requests.patch(123, []),
+                  lambda: aio_asset_requests.post_audio(123, []),
+                  lambda: aio_asset_requests.patch_audio(123, "1", [])):
+        lookup.get_asset_by_no(123)
+        asyncio.run(write())
+        assert 123 not in ASSET_CACHE
@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("mediaprobe")
+pytest.importorskip("rosettapath")
+pytest.importorskip("tclib3")
+
+from pulselib.errors import AssetUncaughtError
+from pulselib.asset import asset_requests, lookup
+from pulselib.asset.assetfieldmaps import ASSET_FIELD_MAPS
+
+FILEPATH_KEY = ASSET_FIELD_MAPS["filepath"].keys
+FILENAME_KEY = ASSET_FIELD_MAPS["filename"].keys
+
+
+@pytest.fixture
+def query(monkeypatch):
+    def fake_query(query: dict, columns=None) -> list[dict]:
+        directory = query[FILEPATH_KEY]
+        if directory == "/broken":
+            raise AssetUncaughtError(query, "boom")
+        return [{FILENAME_KEY: name, FILEPATH_KEY: directory} for name in query[FILENAME_KEY]["$in"]
+                if name.startswith("found")]
+    monkeypatch.setattr(asset_requests, "query", fake_query)
+
+
+def test_failed_directory_only_affects_its_paths(query):
+    errors: dict[str, Exception] = {}
+    found = lookup.get_assets_by_path(["/broken/a.mov", "/ok/found.mov", "/ok/new.mov"], errors=errors)
+    assert set(errors) == {"/broken/a.mov"}
+    assert isinstance(errors["/broken/a.mov"], AssetUncaughtError)
+    assert found["/ok/found.mov"][FILENAME_KEY] == "found.mov"
+    assert found["/ok/new.mov"] == {}
+
+
+def test_failed_directory_raises_without_errors(query):
+    with pytest.raises(AssetUncaughtError):
+        lookup.get_assets_by_path(["/ok/found.mov", "/broken/a.mov"])
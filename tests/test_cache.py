@@ -0,0 +1,20 @@
+from pulselib.cache import TTLCache
+
+
+def test_keyfunc_normalises_every_operation():
+    cache: TTLCache[str, dict] = TTLCache(keyfunc=str)
+    cache.set(123, {"a": 1})
+    assert cache.get("123") == {"a": 1}
+    assert "123" in cache and 123 in cache
+    cache.invalidate("123")
+    assert 123 not in cache
+    cache.update([(7, {}), ("8", {})])
+    assert 7 in cache and "7" in cache and 8 in cache
+    assert len(cache) == 2
+
+
+def test_expired_entries_are_dropped():
+    cache: TTLCache[str, int] = TTLCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
@@ -0,0 +1,117 @@
+import pytest
+import requests
+
+from pulselib.client import Client
+from pulselib.errors import RequestAppliedError
+from pulselib.governor import Governor
+from pulselib.retry import RetryPolicy, SERVER_ERROR_STATUSES
+
+URL = "http://mediapulse.test/api/JmJob"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeSession:
+    """ Replays outcomes in order, an exception instance is raised instead of returned """
+    def __init__(self, *outcomes) -> None:
+        self.outcomes = list(outcomes)
+        self.calls: list[str] = []
+        self.responses: list[FakeResponse] = []
+
+    def request(self, method: str, url: str, **kwargs):
+        self.calls.append(method)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = FakeResponse(outcome)
+        self.responses.append(response)
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def make_client(*outcomes, **policy) -> Client:
+    policy.setdefault("retries", 2)
+    client = Client(auth=("u", "p"), retry_policy=RetryPolicy(backoff=0, max_backoff=0, **policy),
+                    governor=Governor({}))
+    client.session = FakeSession(*outcomes)  # type: ignore
+    return client
+
+
+def test_gateway_error_is_retried():
+    client = make_client(502, 200)
+    assert client.get(URL).status_code == 200
+    assert client.session.calls == ["GET", "GET"]
+
+
+def test_retried_response_is_closed_and_last_one_returned():
+    client = make_client(503, 503, 503)
+    response = client.get(URL)
+    assert response.status_code == 503
+    assert len(client.session.calls) == 3
+    assert [r.closed for r in client.session.responses] == [True, True, False]
+    assert response is client.session.responses[-1]
+
+
+def test_500_is_not_retried_by_default():
+    client = make_client(500, 200)
+    assert client.get(URL).status_code == 500
+    assert client.session.calls == ["GET"]
+
+
+def test_500_is_retried_when_opted_in():
+    client = make_client(500, 200, retry_statuses=SERVER_ERROR_STATUSES)
+    assert client.get(URL).status_code == 200
+
+
+def test_connection_error_is_retried():
+    client = make_client(requests.ConnectionError("reset"), 200)
+    assert client.get(URL).status_code == 200
+
+
+def test_connection_error_raised_when_out_of_retries():
+    client = make_client(requests.ConnectionError("reset"), requests.ConnectionError("reset"), retries=1)
+    with pytest.raises(requests.ConnectionError):
+        client.get(URL)
+
+
+def test_post_is_not_retried_without_opt_in():
+    client = make_client(502, 200)
+    assert client.post(URL, json={}).status_code == 502
+    assert client.session.calls == ["POST"]
+
+
+def test_post_is_retried_with_opt_in():
+    client = make_client(502, 200)
+    assert client.post(URL, json={}, retry=True).status_code == 200
+
+
+def test_precheck_true_raises_request_applied():
+    client = make_client(502, 200)
+    with pytest.raises(RequestAppliedError):
+        client.post(URL, json={}, retry=True, precheck=lambda: True)
+    assert client.session.calls == ["POST"]
+
+
+def test_precheck_false_resends():
+    client = make_client(502, 200)
+    checks = []
+    response = client.post(URL, json={}, retry=True, precheck=lambda: checks.append(1) or False)
+    assert response.status_code == 200
+    assert len(checks) == 1
+
+
+def test_delay_is_jittered_exponential_and_capped():
+    policy = RetryPolicy(retries=5, backoff=1.0, max_backoff=3.0)
+    for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 3.0), (6, 3.0)]:
+        for _ in range(50):
+            assert ceiling / 2 <= policy.delay(attempt) <= ceiling
+
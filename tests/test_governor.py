@@ -0,0 +1,228 @@
+import gc
+import time
+import asyncio
+import threading
+
+from pulselib.client import Client
+from pulselib.governor import Gate, Governor, Limit
+from pulselib.retry import RetryPolicy
+from pulselib.utils import iter_json_array
+
+URL = "http://mediapulse.test/api/JmJob"
+
+
+def wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+
+class PeakCounter:
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc) -> None:
+        with self._lock:
+            self.current -= 1
+
+
+def test_token_bucket_spaces_threads():
+    governor = Governor({"DEFAULT": Limit(rate=50.0, burst=2)})
+    start = time.monotonic()
+    threads = [threading.Thread(target=lambda: governor.acquire(URL)()) for _ in range(7)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 2 from the burst, the other 5 at 50/s
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+def test_max_in_flight_threads():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=2)})
+    counter = PeakCounter()
+
+    def work() -> None:
+        with governor.slot(URL), counter:
+            time.sleep(0.02)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.peak == 2
+    assert governor.gates["DEFAULT"].in_flight == 0
+
+
+def test_global_gate_caps_every_family():
+    governor = Governor({"GLOBAL": Limit(max_in_flight=1)})
+    release = governor.acquire(URL)
+    waiter = threading.Thread(target=lambda: governor.acquire("http://elsewhere.test/")())
+    waiter.start()
+    wait_for(lambda: governor.gates["GLOBAL"].waiting == 1)
+    release()
+    waiter.join(timeout=2)
+    assert not waiter.is_alive()
+
+
+def test_token_bucket_asyncio():
+    governor = Governor({"DEFAULT": Limit(rate=50.0, burst=2)})
+
+    async def main() -> float:
+        start = time.monotonic()
+
+        async def one() -> None:
+            async with governor.aslot(URL):
+                pass
+        await asyncio.gather(*(one() for _ in range(7)))
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) >= 5 / 50 * 0.9
+
+
+def test_max_in_flight_asyncio():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=3)})
+    counter = PeakCounter()
+
+    async def main() -> None:
+        async def one() -> None:
+            async with governor.aslot(URL):
+                with counter:
+                    await asyncio.sleep(0.01)
+        await asyncio.gather(*(one() for _ in range(12)))
+
+    asyncio.run(main())
+    assert counter.peak == 3
+
+
+def test_mixed_sync_and_async_waiters():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=1)})
+    counter = PeakCounter()
+
+    def sync_work() -> None:
+        for _ in range(5):
+            with governor.slot(URL), counter:
+                time.sleep(0.005)
+
+    async def async_work() -> None:
+        async def one() -> None:
+            async with governor.aslot(URL):
+                with counter:
+                    await asyncio.sleep(0.005)
+        await asyncio.gather(*(one() for _ in range(5)))
+
+    threads = [threading.Thread(target=sync_work) for _ in range(2)]
+    threads += [threading.Thread(target=lambda: asyncio.run(async_work())) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in threads)
+    assert counter.peak == 1
+
+
+def test_queue_depth():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=1), "TRX_QUERY_URL": Limit(max_in_flight=1)})
+    release = governor.acquire(URL)
+    threads = [threading.Thread(target=lambda: governor.acquire(URL)()) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: governor.queue_depth() == 3)
+    assert governor.queue_depth("DEFAULT") == 3
+    assert governor.queue_depth("TRX_QUERY_URL") == 0
+    release()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert governor.queue_depth() == 0
+
+
+def test_release_is_idempotent():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=1)})
+    release = governor.acquire(URL)
+    release()
+    release()
+    assert governor.gates["DEFAULT"].in_flight == 0
+
+
+def test_stats_refills_tokens():
+    gate = Gate("test", Limit(rate=100.0, burst=5))
+    for _ in range(5):
+        gate.acquire()
+        gate.release()
+    assert gate.stats()["tokens"] < 1
+    time.sleep(0.03)
+    assert gate.stats()["tokens"] >= 2
+
+
+class StreamedResponse:
+    status_code = 200
+    encoding = "utf-8"
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    def iter_content(self, chunk_size: int):
+        yield b"[1, 2, 3]"
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class StreamingSession:
+    def request(self, method: str, url: str, **kwargs) -> StreamedResponse:
+        return StreamedResponse()
+
+
+def make_client(governor: Governor) -> Client:
+    client = Client(auth=("u", "p"), retry_policy=RetryPolicy(retries=0), governor=governor)
+    client.session = StreamingSession()  # type: ignore
+    return client
+
+
+def test_streamed_responses_hold_their_slot_until_closed():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=2)})
+    client = make_client(governor)
+    first = client.get(URL, stream=True)
+    second = client.get(URL, stream=True)
+    assert governor.gates["DEFAULT"].in_flight == 2
+
+    third = []
+    waiter = threading.Thread(target=lambda: third.append(client.get(URL, stream=True)))
+    waiter.start()
+    wait_for(lambda: governor.queue_depth() == 1)
+    assert not third
+
+    assert list(iter_json_array(URL, first, ValueError)) == [1, 2, 3]
+    waiter.join(timeout=2)
+    assert third and first.closed
+    second.close()
+    third[0].close()
+    assert governor.gates["DEFAULT"].in_flight == 0
+
+
+def test_unstreamed_responses_release_at_once():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=1)})
+    client = make_client(governor)
+    for _ in range(3):
+        client.get(URL)
+    assert governor.gates["DEFAULT"].in_flight == 0
+
+
+def test_dropped_streamed_response_returns_its_slot():
+    governor = Governor({"DEFAULT": Limit(max_in_flight=1)})
+    client = make_client(governor)
+    response = client.get(URL, stream=True)
+    assert governor.gates["DEFAULT"].in_flight == 1
+    del response
+    gc.collect()
+    assert governor.gates["DEFAULT"].in_flight == 0
@@ -0,0 +1,27 @@
+import logging
+
+import pytest
+
+pytest.importorskip("mediaprobe")
+pytest.importorskip("rosettapath")
+pytest.importorskip("tclib3")
+
+from pulselib.config import CONFIG
+from pulselib.asset import probe
+
+
+def test_missing_file_under_mounted_root_is_answered_locally(monkeypatch, tmp_path):
+    monkeypatch.setattr(CONFIG, "VOLUME_ROOTS", ("/",))
+    existing = tmp_path / "a.mov"
+    existing.write_bytes(b"")
+    assert probe.local_exists(str(existing)) is True
+    assert probe.local_exists(str(tmp_path / "missing.mov")) is False
+
+
+def test_empty_volume_roots_defers_to_probe_and_warns_once(monkeypatch, tmp_path, caplog):
+    monkeypatch.setattr(CONFIG, "VOLUME_ROOTS", ())
+    monkeypatch.setattr(probe, "_warned_no_roots", False)
+    with caplog.at_level(logging.WARNING, logger=probe.__name__):
+        assert probe.local_exists(str(tmp_path / "missing.mov")) is None
+        assert probe.local_exists(str(tmp_path / "other.mov")) is None
+    assert len([r for r in caplog.records if "PULSELIB_VOLUME_ROOTS" in r.getMessage()]) == 1
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("rosettapath")
+pytest.importorskip("mediaprobe")
+pytest.importorskip("tclib3")
+
+from pulselib.asset.probecache import ProbeCache
+
+
+def test_roundtrip_and_stale_entries(tmp_path):
+    media = tmp_path / "a.mov"
+    media.write_bytes(b"1")
+    cache = ProbeCache(tmp_path / "cache")
+    cache.set(str(media), {"tracks": []}, str(media))
+    assert cache.get(str(media)) == ({"tracks": []}, str(media))
+    media.write_bytes(b"22")
+    assert cache.get(str(media)) is None
+
+
+def test_unusable_cache_dir_disables_the_cache(tmp_path, monkeypatch):
+    media = tmp_path / "a.mov"
+    media.write_bytes(b"1")
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    cache = ProbeCache(blocker / "cache")
+    attempts = []
+    real_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        attempts.append(self)
+        return real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    assert cache.get(str(media)) is None
+    cache.set(str(media), {}, str(media))
+    cache.invalidate()
+    assert cache.get(str(media)) is None
+    assert len(attempts) == 1
@@ -0,0 +1,72 @@
+import time
+import threading
+
+import pytest
+
+from pulselib.resource import qualifications
+from pulselib.resource.qualifications import QualificationCatalogue
+
+
+class FakeRequests:
+    def __init__(self, table: list[dict], report_key: bool = True) -> None:
+        self.table = list(table)
+        self.report_key = report_key
+        self.queries = 0
+        self.posts: list[str] = []
+        self.catalogue: QualificationCatalogue | None = None
+        self._lock = threading.Lock()
+
+    def query_qualifications(self) -> list[dict]:
+        self.queries += 1
+        with self._lock:
+            return list(self.table)
+
+    def post_qualification(self, jdict: dict) -> int | None:
+        assert self.catalogue is not None and not self.catalogue._lock.locked()
+        time.sleep(0.02)
+        with self._lock:
+            qual_no = len(self.table) + 1
+            self.posts.append(jdict["qualification_desc"])
+            self.table.append({"qualification_desc": jdict["qualification_desc"], "qualification_no": qual_no})
+        return qual_no if self.report_key else None
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    def install(table: list[dict], report_key: bool = True) -> tuple[FakeRequests, QualificationCatalogue]:
+        requests = FakeRequests(table, report_key)
+        monkeypatch.setattr(qualifications, "resource_requests", requests)
+        requests.catalogue = QualificationCatalogue()
+        return requests, requests.catalogue
+    return install
+
+
+def test_posted_qualifications_are_added_without_reloading(fake):
+    requests, catalogue = fake([{"qualification_desc": "German", "qualification_no": 1}])
+    found = catalogue.ensure_many(["German", "French", "French"])
+    assert found["French"] == {"qualification_desc": "French", "qualification_no": 2}
+    assert requests.posts == ["French"]
+    # first load plus the recheck before posting
+    assert requests.queries == 2
+    catalogue.ensure_many(["French"])
+    assert requests.queries == 2
+
+
+def test_concurrent_callers_post_each_desc_once(fake):
+    requests, catalogue = fake([])
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(catalogue.ensure_many(["Thai", "Urdu"])))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(requests.posts) == ["Thai", "Urdu"]
+    assert len(results) == 8
+    assert all(result["Thai"]["qualification_no"] == results[0]["Thai"]["qualification_no"] for result in results)
+
+
+def test_unreported_key_falls_back_to_reload(fake):
+    requests, catalogue = fake([], report_key=False)
+    assert catalogue.ensure("Hindi")["qualification_no"] == 1
+    assert requests.queries == 3
@@ -0,0 +1,37 @@
+import json
+
+from pulselib.errors import RequestAppliedError
+from pulselib.resource import resource_requests
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: object = None) -> None:
+        self.status_code = status_code
+        self.text = "" if body is None else json.dumps(body)
+
+
+class FakeClient:
+    def __init__(self, applied: bool) -> None:
+        self.applied = applied
+        self.prechecks = []
+
+    def post(self, url: str, json=None, retry=None, precheck=None) -> FakeResponse:
+        self.prechecks.append(precheck)
+        if self.applied:
+            raise RequestAppliedError("POST", url)
+        return FakeResponse(201)
+
+
+JDICT = {"resource_code": {"resource_code": "LING01"}}
+
+
+def test_post_reports_applied_retry(monkeypatch):
+    monkeypatch.setattr(resource_requests, "CLIENT", FakeClient(applied=True))
+    assert resource_requests.post(JDICT, retry=True) is False
+
+
+def test_post_reports_created(monkeypatch):
+    client = FakeClient(applied=False)
+    monkeypatch.setattr(resource_requests, "CLIENT", client)
+    assert resource_requests.post(JDICT) is True
+    assert client.prechecks == [None]
@@ -0,0 +1,45 @@
+import pytest
+
+from pulselib.errors import JobUncaughtError
+from pulselib.job.salesoffice import SalesOfficeTable
+
+
+class Fetch:
+    def __init__(self) -> None:
+        self.rows = [{"sale_office_no": "1", "sale_office_desc": "Jane Doe"}]
+        self.calls = 0
+
+    def __call__(self) -> list[dict]:
+        self.calls += 1
+        return list(self.rows)
+
+
+def test_hits_are_served_from_one_download():
+    fetch = Fetch()
+    table = SalesOfficeTable(fetch, refresh_interval=None)
+    assert table.desc("1") == "Jane Doe"
+    assert table.desc("1") == "Jane Doe"
+    assert fetch.calls == 1
+
+
+def test_new_office_triggers_one_reload():
+    fetch = Fetch()
+    table = SalesOfficeTable(fetch, refresh_interval=None)
+    table.load()
+    fetch.rows.append({"sale_office_no": "2", "sale_office_desc": "John Roe"})
+    assert table.desc("2") == "John Roe"
+    assert fetch.calls == 2
+
+
+def test_misses_are_remembered_until_refresh():
+    fetch = Fetch()
+    table = SalesOfficeTable(fetch, refresh_interval=None)
+    for _ in range(3):
+        with pytest.raises(JobUncaughtError):
+            table.get("9")
+    # the first load plus one reload for the miss
+    assert fetch.calls == 2
+    fetch.rows.append({"sale_office_no": "9", "sale_office_desc": "Late Add"})
+    table.invalidate()
+    assert table.desc("9") == "Late Add"
+    assert fetch.calls == 3
@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("mediaprobe")
+pytest.importorskip("rosettapath")
+pytest.importorskip("tclib3")
+
+from pulselib.asset.sessions import uploader, session_requests
+
+
+def test_upload_issues_leaves_input_untouched(monkeypatch):
+    posted: list[dict] = []
+    monkeypatch.setattr(session_requests, "post_issues", lambda session_no, chunk: posted.extend(chunk))
+    issues = [{"session_issue_no": n, "session_no": "OLD", "note": n} for n in range(5)]
+    results = uploader.upload_issues("NEW", issues, chunk_size=2, retry_delay=0)
+    assert results.posted == 5 and not results.errors
+    assert all(issue["session_no"] == "OLD" and "session_issue_no" in issue for issue in issues)
+    assert sorted(issue["note"] for issue in posted) == list(range(5))
+    assert all(issue["session_no"] == "NEW" and "session_issue_no" not in issue for issue in posted)
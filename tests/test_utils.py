@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from pulselib import utils
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, chunk_size: int, status_code: int = 200) -> None:
+        self.body = body
+        self.chunk_size = chunk_size
+        self.status_code = status_code
+        self.encoding = "utf-8"
+        self.closed = False
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self.body), self.chunk_size):
+            yield self.body[i:i+self.chunk_size]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+ARRAYS = [
+    [15000000000.0, 1e5, -2.5E-3, 0, 123456789, 7],
+    ["plain", "with \"escaped\" quotes", "unicode é 漢字", "", "[not], {json}"],
+    [{"a": 1, "b": [1, 2, {"c": None}]}, {}, {"nested": {"x": "y"}}, [True, False, None]],
+]
+
+
+@pytest.mark.parametrize("data", ARRAYS)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_json_array_every_chunk_size(data, indent):
+    body = json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+    for chunk_size in range(1, len(body) + 1):
+        response = FakeResponse(body, chunk_size)
+        result = list(utils.iter_json_array("url", response, LookupError))
+        assert result == data, chunk_size
+        assert response.closed
+
+
+def test_iter_json_array_escapes_and_literals():
+    data = ["\u00e9\u6f22 \"q\" \\ \n", True, False, None, float("inf"), -float("inf"), {"k": [None]}]
+    body = json.dumps(data, ensure_ascii=True).encode("utf-8")
+    for chunk_size in range(1, len(body) + 1):
+        assert list(utils.iter_json_array("url", FakeResponse(body, chunk_size), LookupError)) == data
+
+
+class CountingResponse(FakeResponse):
+    chunks_read = 0
+
+    def iter_content(self, chunk_size: int):
+        for chunk in super().iter_content(chunk_size):
+            self.chunks_read += 1
+            yield chunk
+
+
+def test_iter_json_array_malformed_fails_fast():
+    body = b"[{bad}, " + b", ".join([b'"' + b"x" * 100 + b'"'] * 2000) + b"]"
+    response = CountingResponse(body, 256)
+    with pytest.raises(json.JSONDecodeError):
+        list(utils.iter_json_array("url", response, LookupError))
+    assert response.chunks_read <= 2
+    assert response.closed
+
+
+@pytest.mark.parametrize("body", [b"[1, 2", b"[1 2]", b"[15.0", b'[1, {"a" 1}, 2]', b"[1, tru]", b'["a\\x"]'])
+def test_iter_json_array_malformed(body):
+    for chunk_size in range(1, len(body) + 1):
+        with pytest.raises(json.JSONDecodeError):
+            list(utils.iter_json_array("url", FakeResponse(body, chunk_size), LookupError))
+
+
+def test_iter_json_array_error_body():
+    body = b'{"error": "Alternate key not found"}'
+    with pytest.raises(LookupError, match="Alternate key not found"):
+        list(utils.iter_json_array("url", FakeResponse(body, 4), LookupError))
+
+
+def test_iter_json_array_empty_array():
+    assert list(utils.iter_json_array("url", FakeResponse(b"[ ]", 1), LookupError)) == []